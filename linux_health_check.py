@@ -12,21 +12,23 @@ import os
 import sys
 import subprocess
 import logging
+import logging.handlers
 import json
-import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 import re
 import socket
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.mime.base import MIMEBase
-from email import encoders
-import urllib.request
-import urllib.error
+import struct
+import ipaddress
 import configparser
 import stat
+import grp
+import shutil
+import atexit
+import functools
+import time
+import threading
 
 # ============================================================================
 # CONFIGURATION
@@ -42,14 +44,37 @@ import stat
 # Configuration priority: Environment Variables > Config File > Defaults
 # ============================================================================
 
+# Resolve the script location once; all script-relative paths derive from it
+_SCRIPT_PATH = os.path.abspath(__file__)
+_SCRIPT_DIR = os.path.dirname(_SCRIPT_PATH)
+_config_file = _SCRIPT_DIR + "/health_check.cfg"
+
+
+def _snapshot_config(config):
+    """
+    Copy the parsed options of config into {section: {key: value}}.
+
+    Each value is interpolated on its own; an option that fails (e.g. a
+    stray '%' in a password) is skipped and falls back to its default
+    instead of discarding the rest of the file.
+    """
+    snapshot = {}
+    for section in config.sections():
+        values = snapshot[section] = {}
+        for key in config.options(section):
+            try:
+                values[key] = config.get(section, key)
+            except configparser.Error:
+                pass  # Fall through to the default, like an invalid value
+    return snapshot
+
+
 # Try to load user configuration
 _config = None
 _has_config = False
+_config_snapshot = {}
 
 try:
-    _script_dir = os.path.dirname(os.path.abspath(__file__))
-    _config_file = os.path.join(_script_dir, "health_check.cfg")
-
     if os.path.exists(_config_file):
         # Check file permissions for security
         _file_stat = os.stat(_config_file)
@@ -62,6 +87,8 @@ try:
         # Load config file
         _config = configparser.ConfigParser()
         _config.read(_config_file)
+        # Snapshot parsed values once so lookups are plain dict reads
+        _config_snapshot = _snapshot_config(_config)
         print(f"✓ Loaded configuration from: {_config_file}")
         _has_config = True
     else:
@@ -74,12 +101,40 @@ except Exception as _e:
     _has_config = False
 
 
+_BOOL_TRUE = frozenset({"true", "1", "yes", "on"})
+_FLOAT_RE = re.compile(r"[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?")
+
+
+def _to_bool(value):
+    """Interpret a config/env string as a boolean."""
+    return value.strip().lower() in _BOOL_TRUE
+
+
+def _to_int(value):
+    """Convert a config/env string to int, or None if it is not an integer."""
+    value = value.strip()
+    digits = value[1:] if value[:1] in ("+", "-") else value
+    return int(value) if digits.isdecimal() else None
+
+
+def _to_float(value):
+    """Convert a config/env string to float, or None if it is not a number."""
+    value = value.strip()
+    return float(value) if _FLOAT_RE.fullmatch(value) else None
+
+
+_COERCE = {bool: _to_bool, int: _to_int, float: _to_float, str: str}
+
+
 def _cfg(section, key, default, value_type=str):
     """
     Get config value from environment, config file, or default.
 
     Priority: Environment Variable > Config File > Default
 
+    Environment variables are read live on every call; the config file is
+    read once at startup into _config_snapshot.
+
     Args:
         section: INI section name (e.g., 'output', 'email', 'smtp')
         key: Configuration key name (e.g., 'output_dir', 'enabled')
@@ -89,35 +144,24 @@ def _cfg(section, key, default, value_type=str):
     Returns:
         Configuration value with proper type
     """
+    coerce = _COERCE.get(value_type, str)
+
     # Priority 1: Environment variable (uppercase key name)
-    env_key = key.upper()
-    env_val = os.getenv(env_key)
+    env_val = os.environ.get(key.upper())
     if env_val is not None:
-        try:
-            if value_type is bool:
-                return env_val.lower() in ("true", "1", "yes", "on")
-            elif value_type is int:
-                return int(env_val)
-            elif value_type is float:
-                return float(env_val)
-            else:
-                return env_val
-        except (ValueError, TypeError):
-            pass  # Fall through to config file or default
+        value = coerce(env_val)
+        if value is not None:
+            return value
+        # Invalid value: fall through to config file or default
 
     # Priority 2: Config file
-    if _has_config and _config and _config.has_option(section, key):
-        try:
-            if value_type is bool:
-                return _config.getboolean(section, key)
-            elif value_type is int:
-                return _config.getint(section, key)
-            elif value_type is float:
-                return _config.getfloat(section, key)
-            else:
-                return _config.get(section, key)
-        except (ValueError, TypeError, configparser.Error):
-            pass  # Fall through to default
+    if _has_config:
+        raw = _config_snapshot.get(section, {}).get(key)
+        if raw is not None:
+            value = coerce(raw)
+            if value is not None:
+                return value
+            # Invalid value: fall through to default
 
     # Priority 3: Default value
     return default
@@ -136,6 +180,7 @@ EMAIL_SUBJECT = str(_cfg("email", "subject", "Linux Health Check Report - {hostn
 # SMTP Configuration
 SMTP_SERVER = str(_cfg("smtp", "server", "localhost"))
 SMTP_PORT = int(_cfg("smtp", "port", 25, int))
+SMTP_SSL_PORT = 465  # SMTPS: TLS from connect rather than STARTTLS
 SMTP_USE_TLS = bool(_cfg("smtp", "use_tls", False, bool))
 SMTP_USERNAME = str(_cfg("smtp", "username", ""))
 SMTP_PASSWORD = str(_cfg("smtp", "password", ""))
@@ -161,25 +206,81 @@ LOAD_CRITICAL_MULTIPLIER = (
 GITHUB_REPO = str(_cfg("version_check", "github_repo", "0xgruber/linux-health-checks"))
 VERSION_CHECK_ENABLED = bool(_cfg("version_check", "enabled", True, bool))
 VERSION_CHECK_TIMEOUT = int(_cfg("version_check", "timeout", 5, int))
+VERSION_CACHE_TTL = 6 * 3600  # Seconds a cached release lookup stays fresh
+
+# Package Metadata Configuration
+PACKAGE_METADATA_MAX_AGE = int(_cfg("packages", "metadata_max_age", 3600, int))
+PACKAGE_METADATA_REFRESH = bool(_cfg("packages", "refresh_metadata", False, bool))
+APT_UPDATE_STAMPS = [
+    "/var/lib/apt/periodic/update-success-stamp",
+    "/var/cache/apt/pkgcache.bin",
+]
+
+# Cache Configuration (small JSON files reused across cron runs)
+CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "linux-health-check",
+)
+VERSION_CACHE_FILE = os.path.join(CACHE_DIR, "release.json")
+OS_INFO_CACHE_FILE = os.path.join(CACHE_DIR, "os_info.json")
 
 # ============================================================================
 # GLOBAL STATE
 # ============================================================================
 
 issues = []
+severity_counts = {}  # severity -> count, maintained by add_issues_bulk
+issues_by_category = {}  # category -> issues in report order
+_issues_lock = threading.Lock()  # Checks may run concurrently (see run_checks)
+_issue_batch = threading.local()  # Per-thread buffer used inside run_checks
 OS_INFO = {}
 HOSTNAME = socket.gethostname()
 
+# Resolve the subject placeholder once rather than on every send
+EMAIL_SUBJECT = EMAIL_SUBJECT.replace("{hostname}", HOSTNAME)
+
+# ============================================================================
+# PRECOMPILED PATTERNS
+# ============================================================================
+
+# sshd_config directives inspected by the SSH checks, matched in one pass.
+# Comment lines never match because the directive must start the line.
+SSHD_DIRECTIVE_RE = re.compile(
+    r"^[ \t]*(PasswordAuthentication|PubkeyAuthentication|HostKey"
+    r"|PubkeyAccepted(?:KeyTypes|Algorithms)|PermitRootLogin)"
+    r"(?:[ \t]*=[ \t]*|[ \t]+)(\S+)",
+    re.MULTILINE,
+)
+
+# /etc/login.defs directives
+PASS_MAX_DAYS_RE = re.compile(r"^\s*PASS_MAX_DAYS")
+
+# Command and log output
+UPGRADABLE_RE = re.compile(rb"upgradable")
+
 # ============================================================================
 # LOGGING SETUP
 # ============================================================================
 
+# Rules framing section headings in the console log and the text report
+BANNER = "=" * 80
+RULE = "-" * 80
+
+# Buffer file log records and write them in batches; logging.shutdown()
+# flushes anything still pending when the interpreter exits.
+_LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+_file_handler = logging.FileHandler(OUTPUT_FILE, mode="w")
+_file_handler.setFormatter(logging.Formatter(_LOG_FORMAT))
+_file_buffer = logging.handlers.MemoryHandler(
+    capacity=256, flushLevel=logging.CRITICAL, target=_file_handler
+)
+
 logging.basicConfig(
     level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
+    format=_LOG_FORMAT,
     handlers=[
         logging.StreamHandler(sys.stdout),
-        logging.FileHandler(OUTPUT_FILE, mode="w"),
+        _file_buffer,
     ],
 )
 logger = logging.getLogger(__name__)
@@ -189,55 +290,270 @@ logger = logging.getLogger(__name__)
 # ============================================================================
 
 
-def run_command(cmd, check=False, timeout=30):
+_prefetched = {}  # tuple(cmd) -> Popen started by prefetch_command()
+
+
+@functools.lru_cache(maxsize=None)
+def _executable_path(name):
+    """Return the PATH lookup of name, or None if it is not found (memoized)."""
+    return shutil.which(name)
+
+
+def _spawn_kwargs(cmd):
+    """
+    Popen arguments shared by prefetch_command() and run_command().
+
+    Passing the resolved executable skips the PATH walk in the child and,
+    on Python 3.13+, lets subprocess use posix_spawn() rather than
+    fork/exec. Descriptors inherited from the caller (cron, systemd, flock
+    wrappers) are still closed for the child.
+    """
+    return {
+        "executable": _executable_path(cmd[0]),
+        # A command that prompts fails fast instead of inheriting the terminal
+        "stdin": subprocess.DEVNULL,
+    }
+
+
+def prefetch_command(cmd):
+    """
+    Start a slow command in the background ahead of time.
+
+    The next run_command() call with the same argument list collects the
+    result instead of starting the command again.
+    """
+    try:
+        _prefetched[tuple(cmd)] = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,  # text=True needs Python 3.7+
+            **_spawn_kwargs(cmd),
+        )
+    except Exception:
+        pass  # run_command() reports the failure when the output is needed
+
+
+def run_command(cmd, check=False, timeout=30, text=True, capture=True):
     """
     Execute a shell command safely without shell=True.
     Returns (returncode, stdout, stderr).
+
+    With text=False, stdout is returned as undecoded bytes so callers that
+    only scan it with grep_output_b() skip the UTF-8 decode pass. With
+    capture=False, output goes to /dev/null and comes back empty, for
+    callers that only need the exit status.
     """
+    empty = "" if text else b""
     try:
         if isinstance(cmd, str):
             cmd = cmd.split()
+        process = _prefetched.pop(tuple(cmd), None) if text else None
+        if process is not None:
+            try:
+                stdout, stderr = process.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.communicate()
+                raise
+            return process.returncode, stdout, stderr
+        output = subprocess.PIPE if capture else subprocess.DEVNULL
         result = subprocess.run(
-            cmd, capture_output=True, text=True, timeout=timeout, check=False
+            cmd,
+            stdout=output,
+            stderr=output,
+            text=text,
+            timeout=timeout,
+            check=False,
+            **_spawn_kwargs(cmd),
         )
+        if not capture:
+            return result.returncode, empty, empty
         return result.returncode, result.stdout, result.stderr
     except subprocess.TimeoutExpired:
-        logger.warning(f"Command timed out: {' '.join(cmd)}")
-        return -1, "", "Command timed out"
+        logger.warning("Command timed out: %s", cmd)
+        return -1, empty, "Command timed out"
     except FileNotFoundError:
-        logger.warning(f"Command not found: {cmd[0]}")
-        return -1, "", f"Command not found: {cmd[0]}"
+        logger.warning("Command not found: %s", cmd[0])
+        return -1, empty, f"Command not found: {cmd[0]}"
     except Exception as e:
-        logger.warning(f"Command failed: {e}")
-        return -1, "", str(e)
+        logger.warning("Command failed: %s", e)
+        return -1, empty, str(e)
 
 
+@functools.lru_cache(maxsize=None)
 def command_exists(cmd):
-    """Check if a command exists in PATH."""
-    rc, _, _ = run_command(["which", cmd])
-    return rc == 0
+    """Check if a command exists in PATH (memoized for the run)."""
+    return _executable_path(cmd) is not None
+
+
+_PATTERN_CACHE = {}
+_PATTERN_TYPE = type(re.compile(""))  # re.Pattern is only public from 3.7
+
+
+def _compile_pattern(pattern, flags=0):
+    """
+    Return a compiled regex for pattern, compiling it only once per run.
+
+    pattern may be a string/bytes pattern or an already compiled regex.
+    """
+    if isinstance(pattern, _PATTERN_TYPE):
+        if not flags or pattern.flags & flags == flags:
+            return pattern
+        pattern, flags = pattern.pattern, pattern.flags | flags
+
+    key = (pattern, flags)
+    compiled = _PATTERN_CACHE.get(key)
+    if compiled is None:
+        compiled = _PATTERN_CACHE[key] = re.compile(pattern, flags)
+    return compiled
 
 
 def grep_output(text, pattern):
     """Python implementation of grep - returns matching lines."""
-    lines = text.split("\n")
-    return [line for line in lines if re.search(pattern, line)]
+    search = _compile_pattern(pattern).search
+    return list(filter(search, text.split("\n")))
 
 
 def grep_count(text, pattern):
     """Count matching lines."""
-    return len(grep_output(text, pattern))
+    # Count without building the list of matching lines grep_output returns
+    search = _compile_pattern(pattern).search
+    return sum(1 for line in text.split("\n") if search(line))
+
+
+def count_substring_in_file(path, needle, chunk_size=1 << 20, limit=None):
+    """
+    Count occurrences of the bytes needle in a file, reading it in chunks.
+
+    Keeps memory bounded to roughly chunk_size regardless of file size. The
+    last len(needle) - 1 bytes of each chunk are carried over so matches
+    spanning a chunk boundary are still counted. If limit is given, reading
+    stops as soon as the count exceeds it, so the result is only exact up
+    to limit. Raises OSError like open().
+    """
+    count = 0
+    carry = b""
+    keep = len(needle) - 1
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            buf = carry + chunk
+            count += buf.count(needle)
+            if limit is not None and count > limit:
+                break
+            carry = buf[-keep:] if keep else b""
+    return count
+
+
+def grep_output_b(data, pattern):
+    """Bytes variant of grep_output for undecoded command output."""
+    search = _compile_pattern(pattern).search
+    return list(filter(search, data.split(b"\n")))
 
 
 def head_lines(text, n=10):
     """Return first n lines."""
-    return "\n".join(text.split("\n")[:n])
+    # maxsplit stops scanning after n newlines instead of splitting everything
+    return "\n".join(text.split("\n", n)[:n])
 
 
 def tail_lines(text, n=10):
     """Return last n lines."""
-    lines = text.split("\n")
-    return "\n".join(lines[-n:] if len(lines) >= n else lines)
+    # Walk backwards over n newlines rather than splitting the whole text
+    idx = len(text)
+    for _ in range(n):
+        idx = text.rfind("\n", 0, idx)
+        if idx < 0:
+            return text
+    return text[idx + 1 :]
+
+
+def read_small_file(path, size=8192):
+    """
+    Read a small text file with raw os.open/os.read calls.
+
+    Skips building a buffered TextIOWrapper for tiny files such as
+    /etc/os-release or sysfs/procfs entries. Raises OSError like open().
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        chunks = []
+        while True:
+            chunk = os.read(fd, size)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return b"".join(chunks).decode("utf-8", "replace")
+
+
+def write_private_file(path, text):
+    """
+    Write text to path as UTF-8 with raw os.open/os.write calls.
+
+    The content is encoded once and written without a buffered text
+    wrapper. A newly created file gets mode 0600, since reports describe
+    the host's security posture. Raises OSError like open().
+    """
+    data = memoryview(text.encode("utf-8"))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        while data:
+            written = os.write(fd, data)
+            data = data[written:]
+    finally:
+        os.close(fd)
+
+
+def read_json_cache(path):
+    """Load a JSON cache file, returning None if it is missing or invalid."""
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def write_json_cache(path, data):
+    """Write a JSON cache file; failures are logged at DEBUG and ignored."""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(data, f)
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug(f"Could not write cache {path}: {e}")
+
+
+_last_timestamp = (None, "")
+
+
+def iso_timestamp():
+    """
+    Return the current local time as an ISO 8601 string (second precision).
+
+    The string is rebuilt at most once per second, so bursts of add_issue()
+    calls share one formatted timestamp.
+    """
+    global _last_timestamp
+
+    now = int(time.time())
+    if _last_timestamp[0] != now:
+        _last_timestamp = (now, datetime.fromtimestamp(now).isoformat())
+    return _last_timestamp[1]
+
+
+_SEVERITY_EMOJI = {
+    "CRITICAL": "🔴",
+    "HIGH": "🟠",
+    "MEDIUM": "🟡",
+    "LOW": "🔵",
+    "INFO": "ℹ️",
+}
 
 
 def add_issue(severity, category, description, details=None):
@@ -247,23 +563,76 @@ def add_issue(severity, category, description, details=None):
         "category": category,
         "description": description,
         "details": details,
-        "timestamp": datetime.now().isoformat(),
-    }
-    issues.append(issue)
-
-    severity_emoji = {
-        "CRITICAL": "🔴",
-        "HIGH": "🟠",
-        "MEDIUM": "🟡",
-        "LOW": "🔵",
-        "INFO": "ℹ️",
+        "timestamp": iso_timestamp(),
     }
+    batch = getattr(_issue_batch, "issues", None)
+    if batch is not None:
+        # Inside run_checks: buffer locally, flushed once per check
+        batch.append(issue)
+    else:
+        add_issues_bulk([issue])
+
+
+def add_issues_bulk(batch):
+    """Add several issues to the global issues list under one lock."""
+    # Hold the lock while logging so a batch's issues and their details
+    # stay together in the log when checks run concurrently
+    with _issues_lock:
+        issues.extend(batch)
+
+        for issue in batch:
+            severity = issue["severity"]
+            severity_counts[severity] = severity_counts.get(severity, 0) + 1
+            issues_by_category.setdefault(issue["category"], []).append(issue)
+
+            # %-style args are only formatted if a handler accepts the record
+            logger.warning(
+                "%s [%s] %s: %s",
+                _SEVERITY_EMOJI.get(issue["severity"], ""),
+                issue["severity"],
+                issue["category"],
+                issue["description"],
+            )
+            if issue["details"]:
+                logger.info("  Details: %s", issue["details"])
 
-    logger.warning(
-        f"{severity_emoji.get(severity, '')} [{severity}] {category}: {description}"
-    )
-    if details:
-        logger.info(f"  Details: {details}")
+
+def _run_batched(check):
+    """
+    Run a check with add_issue() buffering into a list.
+
+    Returns (batch, exc): the issues the check reported and the exception
+    it raised, or None. The exception is handed back rather than raised so
+    run_checks() can flush earlier checks' issues first.
+    """
+    _issue_batch.issues = batch = []
+    try:
+        check()
+    except BaseException as exc:
+        return batch, exc
+    finally:
+        _issue_batch.issues = None
+    return batch, None
+
+
+def run_checks(checks):
+    """
+    Run independent check functions concurrently.
+
+    Checks spend most of their time waiting on subprocesses and file I/O,
+    which release the GIL, so a thread pool overlaps those waits. Each
+    check's issues are buffered and flushed in the order the checks were
+    given, so the report order does not depend on thread scheduling. If a
+    check raises, the issues of the checks before it and whatever it
+    reported before failing are flushed, then its exception is re-raised,
+    as it would be when running the checks one after another.
+    """
+    max_workers = max(1, min(len(checks), 32, 4 * (os.cpu_count() or 1)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for batch, exc in executor.map(_run_batched, checks):
+            add_issues_bulk(batch)
+            if exc is not None:
+                raise exc
 
 
 # ============================================================================
@@ -271,6 +640,7 @@ def add_issue(severity, category, description, details=None):
 # ============================================================================
 
 
+@functools.lru_cache(maxsize=32)
 def parse_semantic_version(version_string):
     """
     Parse semantic version string into tuple of integers.
@@ -342,6 +712,34 @@ def compare_versions(current, latest):
         return 1
 
 
+def _load_release_cache():
+    """
+    Return the cached (version, release_url, changelog_url) tuple if the
+    cache file is fresh and was written for GITHUB_REPO, otherwise None.
+    """
+    try:
+        if time.time() - os.stat(VERSION_CACHE_FILE).st_mtime >= VERSION_CACHE_TTL:
+            return None
+    except OSError:
+        return None
+
+    cached = read_json_cache(VERSION_CACHE_FILE)
+    if not cached or cached.get("repo") != GITHUB_REPO or not cached.get("v"):
+        return None
+    return cached["v"], cached.get("url", ""), cached.get("url", "")
+
+
+def _save_release_cache(version, release_url):
+    """Persist a successful release lookup; failures are ignored."""
+    write_json_cache(
+        VERSION_CACHE_FILE,
+        {"repo": GITHUB_REPO, "v": version, "url": release_url, "ts": time.time()},
+    )
+
+
+_RELEASE_RESPONSE_LIMIT = 1024 * 1024  # Max bytes read from the releases API
+
+
 def check_github_releases():
     """
     Query GitHub Releases API for latest version.
@@ -350,6 +748,9 @@ def check_github_releases():
         Tuple of (version, release_url, changelog_url) on success
         Tuple of (None, None, None) on failure
 
+    Successful lookups are cached in VERSION_CACHE_FILE for
+    VERSION_CACHE_TTL seconds so frequent (cron) runs skip the HTTP call.
+
     Environment Variables:
         DISABLE_VERSION_CHECK: Set to "1" to skip check
         VERSION_CHECK_TIMEOUT: Timeout in seconds (default: 3)
@@ -359,6 +760,16 @@ def check_github_releases():
         logger.debug("Version check disabled via DISABLE_VERSION_CHECK")
         return None, None, None
 
+    cached = _load_release_cache()
+    if cached:
+        logger.debug(f"Using cached latest version: {cached[0]}")
+        return cached
+
+    # Imported here: urllib.request pulls in http.client, email and ssl,
+    # which a cached or disabled check never needs
+    import urllib.request
+    import urllib.error
+
     # Build API URL
     api_url = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
 
@@ -376,7 +787,9 @@ def check_github_releases():
         # Fetch with timeout
         logger.debug(f"Fetching latest release from: {api_url}")
         with urllib.request.urlopen(request, timeout=timeout) as response:
-            data = json.loads(response.read().decode("utf-8"))
+            # json.loads accepts bytes directly; cap the read as release
+            # metadata is small
+            data = json.loads(response.read(_RELEASE_RESPONSE_LIMIT))
 
         # Parse response
         tag_name = data.get("tag_name", "")
@@ -385,6 +798,8 @@ def check_github_releases():
         changelog_url = release_url  # Same as release URL
 
         logger.debug(f"Latest version: {version}")
+        if version:
+            _save_release_cache(version, release_url)
         return version, release_url, changelog_url
 
     except urllib.error.HTTPError as e:
@@ -480,12 +895,67 @@ def check_version_update():
 # ============================================================================
 
 
+_OS_RELEASE_RE = re.compile(
+    r"""^(ID|VERSION_ID)=["']?([^"'\n]*)["']?[ \t]*$""", re.MULTILINE
+)
+_OS_RELEASE_KEYS = {"ID": "distribution", "VERSION_ID": "version"}
+_DETECT_COMMANDS = ("rpm", "dpkg", "pacman", "firewall-cmd", "ufw", "iptables")
+
+
+def _os_info_cache_key():
+    """
+    Return the cache key for the persisted OS_INFO, or None if
+    /etc/os-release cannot be read.
+
+    The key covers every input of detect_os(): /etc/os-release, PATH and
+    the mtime of each PATH directory (so installing or removing firewalld,
+    ufw or iptables invalidates it), the SELinux/AppArmor sysfs entries,
+    and the boot id, so a reboot always re-detects.
+    """
+    try:
+        release_stat = os.stat("/etc/os-release")
+    except OSError:
+        return None
+
+    path = os.environ.get("PATH", "")
+    dir_mtimes = []
+    for directory in path.split(os.pathsep):
+        try:
+            dir_mtimes.append(os.stat(directory).st_mtime_ns)
+        except OSError:
+            dir_mtimes.append(None)
+
+    try:
+        boot_id = read_small_file("/proc/sys/kernel/random/boot_id").strip()
+    except OSError:
+        boot_id = None
+
+    return [
+        release_stat.st_mtime_ns,
+        release_stat.st_size,
+        path,
+        dir_mtimes,
+        os.access("/sys/fs/selinux", os.F_OK),
+        os.access(APPARMOR_SECURITYFS_PATH, os.F_OK),
+        boot_id,
+    ]
+
+
 def detect_os():
     """Detect OS distribution, package manager, firewall, and security framework."""
     global OS_INFO
 
     logger.info("Detecting OS configuration...")
 
+    # Reuse the previous detection while nothing it is derived from changed
+    cache_key = _os_info_cache_key()
+    if cache_key:
+        cached = read_json_cache(OS_INFO_CACHE_FILE)
+        if cached and cached.get("key") == cache_key and cached.get("os_info"):
+            OS_INFO = cached["os_info"]
+            logger.info(f"OS Detection (cached): {OS_INFO}")
+            return OS_INFO
+
     OS_INFO = {
         "distribution": "Unknown",
         "version": "Unknown",
@@ -495,37 +965,45 @@ def detect_os():
     }
 
     # Detect distribution
-    if os.path.exists("/etc/os-release"):
-        rc, stdout, _ = run_command(["cat", "/etc/os-release"])
-        if rc == 0:
-            for line in stdout.split("\n"):
-                if line.startswith("ID="):
-                    OS_INFO["distribution"] = line.split("=")[1].strip('"')
-                elif line.startswith("VERSION_ID="):
-                    OS_INFO["version"] = line.split("=")[1].strip('"')
+    try:
+        content = read_small_file("/etc/os-release")
+    except OSError:
+        content = ""
+
+    for key, value in _OS_RELEASE_RE.findall(content):
+        OS_INFO[_OS_RELEASE_KEYS[key]] = value
+
+    # Probe all candidate commands concurrently, then pick by priority
+    with ThreadPoolExecutor(max_workers=len(_DETECT_COMMANDS)) as executor:
+        present = dict(
+            zip(_DETECT_COMMANDS, executor.map(command_exists, _DETECT_COMMANDS))
+        )
 
     # Detect package manager
-    if command_exists("rpm"):
+    if present["rpm"]:
         OS_INFO["package_manager"] = "rpm"
-    elif command_exists("dpkg"):
+    elif present["dpkg"]:
         OS_INFO["package_manager"] = "dpkg"
-    elif command_exists("pacman"):
+    elif present["pacman"]:
         OS_INFO["package_manager"] = "pacman"
 
     # Detect firewall
-    if command_exists("firewall-cmd"):
+    if present["firewall-cmd"]:
         OS_INFO["firewall"] = "firewalld"
-    elif command_exists("ufw"):
+    elif present["ufw"]:
         OS_INFO["firewall"] = "ufw"
-    elif command_exists("iptables"):
+    elif present["iptables"]:
         OS_INFO["firewall"] = "iptables"
 
     # Detect security framework
-    if os.path.exists("/sys/fs/selinux"):
+    if os.access("/sys/fs/selinux", os.F_OK):
         OS_INFO["security_framework"] = "selinux"
-    elif os.path.exists("/sys/kernel/security/apparmor"):
+    elif os.access(APPARMOR_SECURITYFS_PATH, os.F_OK):
         OS_INFO["security_framework"] = "apparmor"
 
+    if cache_key:
+        write_json_cache(OS_INFO_CACHE_FILE, {"key": cache_key, "os_info": OS_INFO})
+
     logger.info(f"OS Detection: {OS_INFO}")
     return OS_INFO
 
@@ -535,6 +1013,65 @@ def detect_os():
 # ============================================================================
 
 
+SSHD_CONFIG_PATH = "/etc/ssh/sshd_config"
+
+
+_SSHD_CACHE = {}  # path -> ((mtime_ns, size, inode), directives)
+
+
+def _parse_sshd_config(content):
+    """Collect the values of the directives the SSH checks inspect."""
+    directives = {}
+    for name, value in SSHD_DIRECTIVE_RE.findall(content):
+        if name.startswith("PubkeyAccepted"):
+            name = "PubkeyAccepted"
+        directives.setdefault(name, []).append(value)
+    return directives
+
+
+def load_sshd_config(path=SSHD_CONFIG_PATH):
+    """
+    Return sshd_config directive values keyed by directive name.
+
+    Keys are PasswordAuthentication, PubkeyAuthentication, HostKey,
+    PubkeyAccepted (KeyTypes or Algorithms) and PermitRootLogin; each maps
+    to the directive's values in file order, so the last entry is the one
+    in effect. The file is read and scanned once, then reused until its
+    mtime, size or inode changes. Raises OSError (including
+    PermissionError) if the file cannot be read.
+    """
+    st = os.stat(path)
+    stat_key = (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    cached = _SSHD_CACHE.get(path)
+    if cached and cached[0] == stat_key:
+        return cached[1]
+
+    with open(path, "r") as f:
+        directives = _parse_sshd_config(f.read())
+    _SSHD_CACHE[path] = (stat_key, directives)
+    return directives
+
+
+def iter_authorized_keys_files():
+    """Yield readable authorized_keys files for root and users under /home."""
+    candidates = ["/root/.ssh/authorized_keys"]
+    try:
+        with os.scandir("/home") as entries:
+            candidates.extend(
+                os.path.join(entry.path, ".ssh", "authorized_keys")
+                for entry in entries
+                if entry.is_dir()
+            )
+    except OSError:
+        pass
+
+    for path in candidates:
+        # Skip unreadable files up front instead of raising per user
+        if os.access(path, os.R_OK):
+            yield path
+
+
 def check_ssh_status():
     """Check SSH service status and authentication configuration."""
     logger.info("Checking SSH status and authentication methods...")
@@ -548,8 +1085,7 @@ def check_ssh_status():
         return
 
     # SSH is running - now check authentication configuration
-    sshd_config = "/etc/ssh/sshd_config"
-    if not os.path.exists(sshd_config):
+    if not os.path.exists(SSHD_CONFIG_PATH):
         add_issue(
             "MEDIUM",
             "Security",
@@ -559,26 +1095,15 @@ def check_ssh_status():
         return
 
     try:
-        with open(sshd_config, "r") as f:
-            config_content = f.read()
-
-        # Check password authentication
-        password_auth_enabled = True
-        password_lines = grep_output(config_content, r"^\s*PasswordAuthentication")
-        for line in reversed(password_lines):
-            if not line.strip().startswith("#"):
-                if "no" in line.lower():
-                    password_auth_enabled = False
-                break
+        directives = load_sshd_config()
 
-        # Check pubkey authentication
-        pubkey_auth_enabled = True  # Default is yes
-        pubkey_lines = grep_output(config_content, r"^\s*PubkeyAuthentication")
-        for line in reversed(pubkey_lines):
-            if not line.strip().startswith("#"):
-                if "no" in line.lower():
-                    pubkey_auth_enabled = False
-                break
+        # Check password authentication (last setting wins)
+        password_values = directives.get("PasswordAuthentication", ["yes"])
+        password_auth_enabled = password_values[-1].lower() != "no"
+
+        # Check pubkey authentication (default is yes)
+        pubkey_values = directives.get("PubkeyAuthentication", ["yes"])
+        pubkey_auth_enabled = pubkey_values[-1].lower() != "no"
 
         # If password auth is enabled (and pubkey might be disabled)
         if password_auth_enabled:
@@ -597,46 +1122,35 @@ def check_ssh_status():
             strong_keys_found = []
 
             # Check HostKey directives for key types in use
-            hostkey_lines = grep_output(config_content, r"^\s*HostKey\s+")
-            for line in hostkey_lines:
-                if not line.strip().startswith("#"):
-                    if "rsa" in line.lower() or "dsa" in line.lower():
-                        weak_keys_found.append(line.strip())
-                    elif "ed25519" in line.lower() or "ecdsa" in line.lower():
-                        strong_keys_found.append(line.strip())
+            for hostkey in directives.get("HostKey", []):
+                hostkey_lower = hostkey.lower()
+                if "rsa" in hostkey_lower or "dsa" in hostkey_lower:
+                    weak_keys_found.append(f"HostKey {hostkey}")
+                elif "ed25519" in hostkey_lower or "ecdsa" in hostkey_lower:
+                    strong_keys_found.append(f"HostKey {hostkey}")
 
             # Check PubkeyAcceptedKeyTypes or PubkeyAcceptedAlgorithms (newer OpenSSH)
-            accepted_key_lines = grep_output(
-                config_content, r"^\s*PubkeyAccepted(KeyTypes|Algorithms)"
+            weak_algo_allowed = any(
+                "rsa" in algorithms.lower() or "dsa" in algorithms.lower()
+                for algorithms in directives.get("PubkeyAccepted", [])
             )
-            weak_algo_allowed = False
-            for line in accepted_key_lines:
-                if not line.strip().startswith("#"):
-                    if "rsa" in line.lower() or "dsa" in line.lower():
-                        weak_algo_allowed = True
 
             # Check authorized_keys for actual key types (check common locations)
-            auth_keys_paths = [
-                "/root/.ssh/authorized_keys",
-                "/home/*/.ssh/authorized_keys",
-            ]
-
             rsa_keys_in_use = False
             ed25519_keys_in_use = False
 
-            for pattern in auth_keys_paths:
-                import glob
-
-                for auth_file in glob.glob(pattern):
-                    try:
-                        with open(auth_file, "r") as f:
-                            auth_content = f.read()
-                            if "ssh-rsa" in auth_content or "ssh-dss" in auth_content:
-                                rsa_keys_in_use = True
-                            if "ssh-ed25519" in auth_content:
-                                ed25519_keys_in_use = True
-                    except (PermissionError, IOError):
-                        pass
+            for auth_file in iter_authorized_keys_files():
+                try:
+                    with open(auth_file, "rb") as f:
+                        auth_content = f.read()
+                except OSError:
+                    continue
+                if b"ssh-rsa" in auth_content or b"ssh-dss" in auth_content:
+                    rsa_keys_in_use = True
+                if b"ssh-ed25519" in auth_content:
+                    ed25519_keys_in_use = True
+                if rsa_keys_in_use and ed25519_keys_in_use:
+                    break
 
             # Determine severity based on findings
             if rsa_keys_in_use or weak_keys_found or weak_algo_allowed:
@@ -685,19 +1199,22 @@ def check_wheel_group():
 
     # Try wheel first (RHEL/CentOS), then sudo (Debian/Ubuntu)
     for group in ["wheel", "sudo"]:
-        rc, stdout, _ = run_command(["getent", "group", group])
-        if rc == 0:
-            members = stdout.split(":")[-1].strip()
-            if not members:
-                add_issue(
-                    "CRITICAL",
-                    "Security",
-                    f"Group '{group}' has no members",
-                    "No users can use sudo - administrative access may be blocked",
-                )
-            else:
-                add_issue("INFO", "Security", f"Group '{group}' members: {members}")
-            return
+        # grp queries NSS directly, like getent, without spawning a process
+        try:
+            members = ",".join(grp.getgrnam(group).gr_mem)
+        except KeyError:
+            continue
+
+        if not members:
+            add_issue(
+                "CRITICAL",
+                "Security",
+                f"Group '{group}' has no members",
+                "No users can use sudo - administrative access may be blocked",
+            )
+        else:
+            add_issue("INFO", "Security", f"Group '{group}' members: {members}")
+        return
 
     add_issue(
         "MEDIUM",
@@ -736,19 +1253,24 @@ def check_firewall():
             add_issue("INFO", "Security", "ufw is active")
 
     elif OS_INFO["firewall"] == "iptables":
-        rc, stdout, _ = run_command(["iptables", "-L", "-n"])
+        # -S prints one line per rule, far less output than -L -n. Always
+        # ask iptables itself: with iptables-nft the rules live in nftables,
+        # so /proc/net/ip_tables_names says nothing about them
+        rc, stdout, _ = run_command(["iptables", "-S"])
+        rule_count = stdout.count("\n-A ") + stdout.startswith("-A ")
         if rc == 0:
-            rule_count = len(stdout.split("\n"))
-            if rule_count < 10:
+            # An empty filter table is exactly what the old "-L -n output under
+            # 10 lines" test flagged: its three built-in chains print 9 lines
+            if rule_count == 0:
                 add_issue(
                     "MEDIUM",
                     "Security",
                     "iptables has minimal rules",
-                    f"Only {rule_count} lines of iptables output",
+                    "No rules found in the filter table",
                 )
             else:
                 add_issue(
-                    "INFO", "Security", f"iptables is configured ({rule_count} lines)"
+                    "INFO", "Security", f"iptables is configured ({rule_count} rules)"
                 )
     else:
         add_issue(
@@ -759,37 +1281,49 @@ def check_firewall():
         )
 
 
+SELINUX_ENFORCE_PATH = "/sys/fs/selinux/enforce"
+APPARMOR_SECURITYFS_PATH = "/sys/kernel/security/apparmor"
+
+
 def check_selinux_apparmor():
     """Check SELinux or AppArmor status."""
     logger.info("Checking mandatory access control (SELinux/AppArmor)...")
 
-    if OS_INFO["security_framework"] == "selinux":
-        rc, stdout, _ = run_command(["getenforce"])
-        if rc == 0:
-            status = stdout.strip()
-            if status == "Enforcing":
-                add_issue(
-                    "INFO",
-                    "Security",
-                    "SELinux is in Enforcing mode",
-                    "Good security posture",
-                )
-            elif status == "Permissive":
-                add_issue(
-                    "MEDIUM",
-                    "Security",
-                    "SELinux is in Permissive mode",
-                    "SELinux should be in Enforcing mode for production",
-                )
-            else:
-                add_issue(
-                    "HIGH",
-                    "Security",
-                    "SELinux is Disabled",
-                    "SELinux should be enabled and enforcing",
-                )
+    framework = OS_INFO["security_framework"]
+    if framework == "selinux":
+        # Same answer as getenforce: 1 is enforcing, 0 permissive
+        try:
+            enforce = read_small_file(SELINUX_ENFORCE_PATH).strip()
+        except OSError:
+            enforce = None
+        if enforce is None:
+            # /sys/fs/selinux exists but selinuxfs is not mounted, so SELinux
+            # is not active; look at AppArmor instead, if the kernel has it
+            if os.access(APPARMOR_SECURITYFS_PATH, os.F_OK):
+                framework = "apparmor"
+        elif enforce == "1":
+            add_issue(
+                "INFO",
+                "Security",
+                "SELinux is in Enforcing mode",
+                "Good security posture",
+            )
+        elif enforce == "0":
+            add_issue(
+                "MEDIUM",
+                "Security",
+                "SELinux is in Permissive mode",
+                "SELinux should be in Enforcing mode for production",
+            )
+        else:
+            add_issue(
+                "HIGH",
+                "Security",
+                "SELinux is Disabled",
+                "SELinux should be enabled and enforcing",
+            )
 
-    elif OS_INFO["security_framework"] == "apparmor":
+    if framework == "apparmor":
         rc, stdout, _ = run_command(["aa-status"])
         if rc == 0:
             if "apparmor module is loaded" in stdout.lower():
@@ -798,7 +1332,7 @@ def check_selinux_apparmor():
                 add_issue("MEDIUM", "Security", "AppArmor status unclear", stdout[:200])
         else:
             add_issue("MEDIUM", "Security", "Cannot determine AppArmor status")
-    else:
+    elif framework is None:
         add_issue(
             "MEDIUM",
             "Security",
@@ -827,30 +1361,29 @@ def check_failed_logins():
     )
 
     try:
-        with open(log_file, "r") as f:
-            content = f.read()
-            failed_count = grep_count(content, r"Failed password")
+        # Stream the log in chunks and stop once the highest threshold is hit
+        failed_count = count_substring_in_file(log_file, b"Failed password", limit=100)
 
-            if failed_count > 100:
-                add_issue(
-                    "HIGH",
-                    "Security",
-                    f"{failed_count} failed login attempts detected",
-                    f"Check {log_file} for details",
-                )
-            elif failed_count > 20:
-                add_issue(
-                    "MEDIUM",
-                    "Security",
-                    f"{failed_count} failed login attempts detected",
-                    f"Check {log_file} for details",
-                )
-            elif failed_count > 0:
-                add_issue(
-                    "LOW", "Security", f"{failed_count} failed login attempts detected"
-                )
-            else:
-                add_issue("INFO", "Security", "No failed login attempts detected")
+        if failed_count > 100:
+            add_issue(
+                "HIGH",
+                "Security",
+                "More than 100 failed login attempts detected",
+                f"Check {log_file} for details",
+            )
+        elif failed_count > 20:
+            add_issue(
+                "MEDIUM",
+                "Security",
+                f"{failed_count} failed login attempts detected",
+                f"Check {log_file} for details",
+            )
+        elif failed_count > 0:
+            add_issue(
+                "LOW", "Security", f"{failed_count} failed login attempts detected"
+            )
+        else:
+            add_issue("INFO", "Security", "No failed login attempts detected")
     except PermissionError:
         add_issue(
             "LOW",
@@ -860,99 +1393,119 @@ def check_failed_logins():
         )
 
 
-def check_open_ports():
-    """Check for listening network ports."""
-    logger.info("Checking open ports...")
+TCP_LISTEN_STATE = "0A"  # TCP_LISTEN in /proc/net/tcp{,6}
 
-    rc, stdout, _ = run_command(["ss", "-tuln"])
-    if rc != 0:
-        rc, stdout, _ = run_command(["netstat", "-tuln"])
+# Legacy cleartext services that should never be listening
+DANGEROUS_PORTS = {
+    23: "Telnet",
+    21: "FTP",
+    69: "TFTP",
+    513: "rlogin",
+    514: "rsh",
+}
 
-    if rc == 0:
-        listening_lines = grep_output(stdout, r"LISTEN")
-        port_count = len(listening_lines)
 
-        if port_count > 20:
-            add_issue(
-                "MEDIUM",
-                "Security",
-                f"{port_count} listening ports detected",
-                "Review open ports for unnecessary services",
-            )
-        else:
-            add_issue("INFO", "Security", f"{port_count} listening ports detected")
-
-        # Check for common insecure ports
-        dangerous_ports = {
-            "23": "Telnet",
-            "21": "FTP",
-            "69": "TFTP",
-            "513": "rlogin",
-            "514": "rsh",
-        }
+def get_listening_tcp_ports():
+    """
+    Return the local port of every listening TCP socket (IPv4 and IPv6).
 
-        for port, service in dangerous_ports.items():
-            if any(f":{port} " in line for line in listening_lines):
-                add_issue(
-                    "CRITICAL",
-                    "Security",
-                    f"Insecure service {service} listening on port {port}",
-                    f"Port {port} should not be exposed",
-                )
-    else:
+    Reads /proc/net/tcp and /proc/net/tcp6 directly instead of parsing ss or
+    netstat output. A port appears once per listening socket, matching the
+    LISTEN lines ss would print. Returns None if neither file is readable.
+    """
+    ports = []
+    readable = False
+    for table in ("/proc/net/tcp", "/proc/net/tcp6"):
+        try:
+            with open(table, "r") as f:
+                next(f, None)  # Header
+                for line in f:
+                    fields = line.split()
+                    if len(fields) > 3 and fields[3] == TCP_LISTEN_STATE:
+                        ports.append(int(fields[1].rsplit(":", 1)[1], 16))
+            readable = True
+        except (OSError, ValueError, IndexError):
+            continue
+    return ports if readable else None
+
+
+def check_open_ports():
+    """Check for listening network ports."""
+    logger.info("Checking open ports...")
+
+    listening_ports = get_listening_tcp_ports()
+    if listening_ports is None:
         add_issue(
             "LOW",
             "Security",
             "Cannot check open ports",
-            "Neither ss nor netstat available",
+            "/proc/net/tcp and /proc/net/tcp6 are not readable",
+        )
+        return
+
+    port_count = len(listening_ports)
+
+    if port_count > 20:
+        add_issue(
+            "MEDIUM",
+            "Security",
+            f"{port_count} listening ports detected",
+            "Review open ports for unnecessary services",
         )
+    else:
+        add_issue("INFO", "Security", f"{port_count} listening ports detected")
+
+    # Check for common insecure ports
+    open_ports = set(listening_ports)
+    for port, service in DANGEROUS_PORTS.items():
+        if port in open_ports:
+            add_issue(
+                "CRITICAL",
+                "Security",
+                f"Insecure service {service} listening on port {port}",
+                f"Port {port} should not be exposed",
+            )
 
 
 def check_root_login():
     """Check if root can login via SSH."""
     logger.info("Checking SSH root login configuration...")
 
-    sshd_config = "/etc/ssh/sshd_config"
-    if not os.path.exists(sshd_config):
+    if not os.path.exists(SSHD_CONFIG_PATH):
         add_issue(
             "LOW", "Security", "Cannot find sshd_config", "SSH may not be installed"
         )
         return
 
     try:
-        with open(sshd_config, "r") as f:
-            content = f.read()
+        permit_root_values = load_sshd_config().get("PermitRootLogin", [])
 
-        permit_root_lines = grep_output(content, r"^\s*PermitRootLogin")
-
-        if not permit_root_lines:
+        if not permit_root_values:
             add_issue(
                 "MEDIUM",
                 "Security",
                 "PermitRootLogin not explicitly set in sshd_config",
                 "Default may allow root login",
             )
+        elif permit_root_values[-1].lower() == "no":
+            # The last setting is the one in effect
+            add_issue(
+                "INFO",
+                "Security",
+                "Root SSH login is disabled",
+                "Good security practice",
+            )
         else:
-            # Get the last uncommented line
-            for line in reversed(permit_root_lines):
-                if not line.strip().startswith("#"):
-                    if "no" in line.lower():
-                        add_issue(
-                            "INFO",
-                            "Security",
-                            "Root SSH login is disabled",
-                            "Good security practice",
-                        )
-                    else:
-                        add_issue(
-                            "HIGH",
-                            "Security",
-                            "Root SSH login is enabled",
-                            "PermitRootLogin should be set to 'no'",
-                        )
-                    break
+            add_issue(
+                "HIGH",
+                "Security",
+                "Root SSH login is enabled",
+                "PermitRootLogin should be set to 'no'",
+            )
     except PermissionError:
-        add_issue("LOW", "Security", f"Cannot read {sshd_config}", "Permission denied")
+        add_issue(
+            "LOW", "Security", f"Cannot read {SSHD_CONFIG_PATH}", "Permission denied"
+        )
 
 
 def check_password_policy():
@@ -965,9 +1518,7 @@ def check_password_policy():
             with open(login_defs, "r") as f:
                 content = f.read()
 
-            pass_max_days = grep_output(content, r"^\s*PASS_MAX_DAYS")
-            pass_min_days = grep_output(content, r"^\s*PASS_MIN_DAYS")
-            pass_min_len = grep_output(content, r"^\s*PASS_MIN_LEN")
+            pass_max_days = grep_output(content, PASS_MAX_DAYS_RE)
 
             if not pass_max_days or any("99999" in line for line in pass_max_days):
                 add_issue(
@@ -998,17 +1549,32 @@ def check_password_policy():
 # ============================================================================
 
 
+def format_uptime(seconds):
+    """Format seconds like `uptime -p` (e.g. "up 2 days, 3 hours, 5 minutes")."""
+    minutes_total = int(seconds) // 60
+    days, remainder = divmod(minutes_total, 1440)
+    hours, minutes = divmod(remainder, 60)
+
+    parts = []
+    for value, unit in ((days, "day"), (hours, "hour"), (minutes, "minute")):
+        if value:
+            parts.append(f"{value} {unit}{'s' if value != 1 else ''}")
+    return "up " + (", ".join(parts) if parts else "0 minutes")
+
+
 def check_uptime():
     """Check system uptime."""
     logger.info("Checking system uptime...")
 
-    rc, stdout, _ = run_command(["uptime", "-p"])
-    if rc == 0:
-        add_issue("INFO", "System Health", f"System uptime: {stdout.strip()}")
-    else:
-        rc, stdout, _ = run_command(["uptime"])
-        if rc == 0:
-            add_issue("INFO", "System Health", f"Uptime: {stdout.strip()}")
+    try:
+        uptime_seconds = float(read_small_file("/proc/uptime").split()[0])
+    except (OSError, ValueError, IndexError) as e:
+        add_issue("LOW", "System Health", "Cannot check uptime", str(e))
+        return
+
+    add_issue(
+        "INFO", "System Health", f"System uptime: {format_uptime(uptime_seconds)}"
+    )
 
 
 def check_load_average():
@@ -1016,80 +1582,86 @@ def check_load_average():
     logger.info("Checking load average...")
 
     try:
-        with open("/proc/loadavg", "r") as f:
-            loadavg = f.read().strip().split()
-            load_1min = float(loadavg[0])
-            load_5min = float(loadavg[1])
-            load_15min = float(loadavg[2])
-
-        # Get CPU count
-        cpu_count = os.cpu_count() or 1
+        # Round to the two decimals /proc/loadavg reports; some libcs return
+        # the kernel's raw fixed-point values
+        load_1min, load_5min, load_15min = (round(load, 2) for load in os.getloadavg())
+    except OSError as e:
+        add_issue("LOW", "System Health", "Cannot check load average", str(e))
+        return
 
-        load_per_cpu = load_1min / cpu_count
+    cpu_count = os.cpu_count() or 1
+    load_per_cpu = load_1min / cpu_count
 
-        if load_per_cpu > LOAD_CRITICAL_MULTIPLIER:
-            add_issue(
-                "CRITICAL",
-                "System Health",
-                f"Load average critically high: {load_1min} ({load_per_cpu:.2f} per CPU)",
-                f"CPU count: {cpu_count}, 1/5/15 min: {load_1min}/{load_5min}/{load_15min}",
-            )
-        elif load_per_cpu > LOAD_WARNING_MULTIPLIER:
-            add_issue(
-                "HIGH",
-                "System Health",
-                f"Load average high: {load_1min} ({load_per_cpu:.2f} per CPU)",
-                f"CPU count: {cpu_count}, 1/5/15 min: {load_1min}/{load_5min}/{load_15min}",
-            )
-        else:
-            add_issue(
-                "INFO",
-                "System Health",
-                f"Load average normal: {load_1min} ({load_per_cpu:.2f} per CPU)",
-                f"CPU count: {cpu_count}, 1/5/15 min: {load_1min}/{load_5min}/{load_15min}",
-            )
-    except Exception as e:
-        add_issue("LOW", "System Health", "Cannot check load average", str(e))
+    if load_per_cpu > LOAD_CRITICAL_MULTIPLIER:
+        add_issue(
+            "CRITICAL",
+            "System Health",
+            f"Load average critically high: {load_1min} ({load_per_cpu:.2f} per CPU)",
+            f"CPU count: {cpu_count}, 1/5/15 min: {load_1min}/{load_5min}/{load_15min}",
+        )
+    elif load_per_cpu > LOAD_WARNING_MULTIPLIER:
+        add_issue(
+            "HIGH",
+            "System Health",
+            f"Load average high: {load_1min} ({load_per_cpu:.2f} per CPU)",
+            f"CPU count: {cpu_count}, 1/5/15 min: {load_1min}/{load_5min}/{load_15min}",
+        )
+    else:
+        add_issue(
+            "INFO",
+            "System Health",
+            f"Load average normal: {load_1min} ({load_per_cpu:.2f} per CPU)",
+            f"CPU count: {cpu_count}, 1/5/15 min: {load_1min}/{load_5min}/{load_15min}",
+        )
 
 
 def check_memory_usage():
     """Check memory usage."""
     logger.info("Checking memory usage...")
 
-    rc, stdout, _ = run_command(["free", "-m"])
-    if rc == 0:
-        lines = stdout.split("\n")
-        if len(lines) >= 2:
-            mem_line = lines[1].split()
-            if len(mem_line) >= 3:
-                total = int(mem_line[1])
-                used = int(mem_line[2])
-                percent = (used / total) * 100
-
-                if percent > MEMORY_CRITICAL_THRESHOLD:
-                    add_issue(
-                        "CRITICAL",
-                        "System Health",
-                        f"Memory usage critically high: {percent:.1f}% ({used}MB/{total}MB)",
-                        "Consider adding more RAM or reducing memory usage",
-                    )
-                elif percent > MEMORY_WARNING_THRESHOLD:
-                    add_issue(
-                        "HIGH",
-                        "System Health",
-                        f"Memory usage high: {percent:.1f}% ({used}MB/{total}MB)",
-                    )
-                else:
-                    add_issue(
-                        "INFO",
-                        "System Health",
-                        f"Memory usage normal: {percent:.1f}% ({used}MB/{total}MB)",
-                    )
-                return
+    try:
+        meminfo = {}
+        for line in read_small_file("/proc/meminfo").split("\n"):
+            key, sep, value = line.partition(":")
+            if sep:
+                meminfo[key] = int(value.split()[0])
+
+        total_kb = meminfo["MemTotal"]
+        # MemAvailable needs Linux 3.14+; estimate it on older kernels
+        available_kb = meminfo.get("MemAvailable")
+        if available_kb is None:
+            available_kb = (
+                meminfo.get("MemFree", 0)
+                + meminfo.get("Buffers", 0)
+                + meminfo.get("Cached", 0)
+            )
+    except (OSError, ValueError, IndexError, KeyError) as e:
+        add_issue("LOW", "System Health", "Cannot check memory usage", str(e))
+        return
 
-    add_issue(
-        "LOW", "System Health", "Cannot check memory usage", "free command failed"
-    )
+    total = total_kb // 1024
+    used = (total_kb - available_kb) // 1024
+    percent = (used / total) * 100 if total else 0.0
+
+    if percent > MEMORY_CRITICAL_THRESHOLD:
+        add_issue(
+            "CRITICAL",
+            "System Health",
+            f"Memory usage critically high: {percent:.1f}% ({used}MB/{total}MB)",
+            "Consider adding more RAM or reducing memory usage",
+        )
+    elif percent > MEMORY_WARNING_THRESHOLD:
+        add_issue(
+            "HIGH",
+            "System Health",
+            f"Memory usage high: {percent:.1f}% ({used}MB/{total}MB)",
+        )
+    else:
+        add_issue(
+            "INFO",
+            "System Health",
+            f"Memory usage normal: {percent:.1f}% ({used}MB/{total}MB)",
+        )
 
 
 def check_cpu_info():
@@ -1098,14 +1670,17 @@ def check_cpu_info():
 
     if os.path.exists("/proc/cpuinfo"):
         try:
+            # Online CPUs match the "processor" entries in /proc/cpuinfo, so
+            # only the first "model name" line needs to be read from it
+            cpu_count = os.cpu_count() or 1
+            model = None
             with open("/proc/cpuinfo", "r") as f:
-                content = f.read()
-
-            cpu_count = grep_count(content, r"^processor")
-            model_lines = grep_output(content, r"model name")
+                for line in f:
+                    if line.startswith("model name"):
+                        model = line.split(":", 1)[1].strip()
+                        break
 
-            if model_lines:
-                model = model_lines[0].split(":")[1].strip()
+            if model:
                 add_issue("INFO", "System Health", f"CPU: {cpu_count} cores, {model}")
             else:
                 add_issue("INFO", "System Health", f"CPU: {cpu_count} cores")
@@ -1117,34 +1692,58 @@ def check_zombie_processes():
     """Check for zombie processes."""
     logger.info("Checking for zombie processes...")
 
-    rc, stdout, _ = run_command(["ps", "aux"])
-    if rc == 0:
-        zombie_count = grep_count(stdout, r"<defunct>")
+    try:
+        pids = [name for name in os.listdir("/proc") if name.isdigit()]
+    except OSError:
+        add_issue("LOW", "System Health", "Cannot check for zombie processes")
+        return
 
-        if zombie_count > 10:
-            add_issue(
-                "HIGH",
-                "System Health",
-                f"{zombie_count} zombie processes detected",
-                "Large number of zombies may indicate application issues",
-            )
-        elif zombie_count > 0:
-            add_issue(
-                "MEDIUM", "System Health", f"{zombie_count} zombie processes detected"
-            )
-        else:
-            add_issue("INFO", "System Health", "No zombie processes detected")
+    zombie_count = 0
+    for pid in pids:
+        try:
+            with open(f"/proc/{pid}/stat", "rb") as f:
+                stat_line = f.read()
+        except OSError:
+            continue  # Process exited while scanning
+
+        # State is the first field after the parenthesised command name,
+        # which may itself contain spaces or parentheses
+        if stat_line.rpartition(b")")[2].split()[:1] == [b"Z"]:
+            zombie_count += 1
+
+    if zombie_count > 10:
+        add_issue(
+            "HIGH",
+            "System Health",
+            f"{zombie_count} zombie processes detected",
+            "Large number of zombies may indicate application issues",
+        )
+    elif zombie_count > 0:
+        add_issue(
+            "MEDIUM", "System Health", f"{zombie_count} zombie processes detected"
+        )
     else:
-        add_issue("LOW", "System Health", "Cannot check for zombie processes")
+        add_issue("INFO", "System Health", "No zombie processes detected")
 
 
 def check_systemd_failed():
     """Check for failed systemd services."""
     logger.info("Checking for failed systemd services...")
 
-    rc, stdout, _ = run_command(["systemctl", "list-units", "--failed", "--no-pager"])
+    # --plain --no-legend prints exactly one line per failed unit, with no
+    # status bullet or header/footer to filter out
+    rc, stdout, _ = run_command(
+        [
+            "systemctl",
+            "list-units",
+            "--state=failed",
+            "--plain",
+            "--no-legend",
+            "--no-pager",
+        ]
+    )
     if rc == 0:
-        failed_lines = grep_output(stdout, r"●.*failed")
+        failed_lines = [line for line in stdout.splitlines() if line.strip()]
         failed_count = len(failed_lines)
 
         if failed_count > 5:
@@ -1214,103 +1813,241 @@ def check_dmesg_errors():
 # ============================================================================
 
 
-def check_filesystem_usage():
-    """Check filesystem usage."""
-    logger.info("Checking filesystem usage...")
+# Virtual filesystems that df hides or that are always "full" by design
+PSEUDO_FSTYPES = frozenset(
+    {
+        "autofs",
+        "binfmt_misc",
+        "bpf",
+        "cgroup",
+        "cgroup2",
+        "configfs",
+        "debugfs",
+        "devpts",
+        "devtmpfs",
+        "efivarfs",
+        "fusectl",
+        "hugetlbfs",
+        "mqueue",
+        "nsfs",
+        "proc",
+        "pstore",
+        "ramfs",
+        "rpc_pipefs",
+        "securityfs",
+        "squashfs",
+        "sysfs",
+        "tmpfs",
+        "tracefs",
+    }
+)
+# Network filesystems whose statvfs() can block indefinitely when the server
+# is gone (e.g. a hard NFS mount); FUSE mounts ("fuse", "fuse.*") likewise
+NETWORK_FSTYPES = frozenset(
+    {
+        "9p",
+        "afs",
+        "ceph",
+        "cifs",
+        "glusterfs",
+        "lustre",
+        "nfs",
+        "nfs4",
+        "smb3",
+        "smbfs",
+    }
+)
+MOUNT_STAT_TIMEOUT = 10  # Seconds to wait for network/FUSE mounts to answer
+_MOUNT_ESCAPE_RE = re.compile(r"\\([0-7]{3})")
 
-    rc, stdout, _ = run_command(["df", "-h"])
-    if rc == 0:
-        lines = stdout.split("\n")[1:]  # Skip header
 
-        for line in lines:
-            if not line.strip():
+def _unescape_mount_field(field):
+    """Decode the octal escapes (e.g. \\040 for space) used in /proc/mounts."""
+    return _MOUNT_ESCAPE_RE.sub(lambda m: chr(int(m.group(1), 8)), field)
+
+
+def _percent_used(used, available):
+    """Usage percentage rounded up, matching df's Use% column."""
+    total = used + available
+    if total <= 0:
+        return None
+    return -(-used * 100 // total)
+
+
+def _is_network_fstype(fstype):
+    """Whether statvfs() on this filesystem type may hang on a dead server."""
+    return fstype in NETWORK_FSTYPES or fstype == "fuse" or fstype.startswith("fuse.")
+
+
+def _statvfs_usage(device, mountpoint):
+    """
+    Return (device, mountpoint, block_percent, inode_percent) for one mount,
+    or None if it cannot be queried or has no storage.
+    """
+    try:
+        st = os.statvfs(mountpoint)
+    except OSError:
+        return None
+    if st.f_blocks == 0:
+        return None  # Pseudo filesystem with no storage
+
+    block_percent = _percent_used(st.f_blocks - st.f_bfree, st.f_bavail)
+    inode_percent = _percent_used(st.f_files - st.f_ffree, st.f_ffree)
+    return device, mountpoint, block_percent, inode_percent
+
+
+@functools.lru_cache(maxsize=1)
+def get_mount_usage():
+    """
+    Return block and inode usage for each real mounted filesystem.
+
+    Mounts come from /proc/mounts and sizes from one os.statvfs() call per
+    mountpoint, so filesystem and inode checks share a single sweep without
+    running df. Network and FUSE mounts are queried from daemon threads and
+    given MOUNT_STAT_TIMEOUT seconds in total, so a dead server cannot hang
+    the run.
+
+    Returns (usage, unresponsive): usage is a list of (device, mountpoint,
+    block_percent, inode_percent) tuples, where inode_percent is None when
+    the filesystem does not track inodes; unresponsive lists the
+    mountpoints that did not answer in time. Raises OSError if /proc/mounts
+    cannot be read.
+    """
+    mounts = {}
+    with open("/proc/mounts", "r") as f:
+        for line in f:
+            fields = line.split()
+            if len(fields) < 3 or fields[2] in PSEUDO_FSTYPES:
                 continue
+            device = _unescape_mount_field(fields[0])
+            mountpoint = _unescape_mount_field(fields[1])
+            # Later mounts shadow earlier ones
+            mounts[mountpoint] = (device, _is_network_fstype(fields[2]))
+
+    results = {}
+    waiting = []
+    for mountpoint, (device, network) in mounts.items():
+        if not network:
+            results[mountpoint] = _statvfs_usage(device, mountpoint)
+            continue
+        # Daemon threads: one stuck in statvfs() must not block interpreter exit
+        thread = threading.Thread(
+            target=lambda m=mountpoint, d=device: results.__setitem__(
+                m, _statvfs_usage(d, m)
+            ),
+            daemon=True,
+        )
+        thread.start()
+        waiting.append((mountpoint, thread))
+
+    deadline = time.monotonic() + MOUNT_STAT_TIMEOUT
+    unresponsive = []
+    for mountpoint, thread in waiting:
+        thread.join(max(0.0, deadline - time.monotonic()))
+        if thread.is_alive():
+            unresponsive.append(mountpoint)
+
+    usage = [
+        results[mountpoint]
+        for mountpoint in mounts
+        if mountpoint not in unresponsive and results.get(mountpoint)
+    ]
+    return usage, unresponsive
 
-            parts = line.split()
-            if len(parts) >= 6:
-                filesystem = parts[0]
-                use_percent_str = parts[4].rstrip("%")
-                mountpoint = parts[5]
 
-                # Skip pseudo filesystems
-                if filesystem in ["tmpfs", "devtmpfs", "none", "udev"]:
-                    continue
+def check_filesystem_usage():
+    """Check filesystem usage."""
+    logger.info("Checking filesystem usage...")
 
-                try:
-                    use_percent = int(use_percent_str)
-
-                    if use_percent >= FILESYSTEM_CRITICAL_THRESHOLD:
-                        add_issue(
-                            "CRITICAL",
-                            "Storage",
-                            f"Filesystem {mountpoint} critically full: {use_percent}%",
-                            f"{filesystem} mounted at {mountpoint}",
-                        )
-                    elif use_percent >= FILESYSTEM_WARNING_THRESHOLD:
-                        add_issue(
-                            "HIGH",
-                            "Storage",
-                            f"Filesystem {mountpoint} filling up: {use_percent}%",
-                            f"{filesystem} mounted at {mountpoint}",
-                        )
-                    elif use_percent >= 75:
-                        add_issue(
-                            "MEDIUM",
-                            "Storage",
-                            f"Filesystem {mountpoint} at {use_percent}%",
-                            f"{filesystem} mounted at {mountpoint}",
-                        )
-                except ValueError:
-                    continue
-    else:
+    try:
+        mount_usage, unresponsive = get_mount_usage()
+    except OSError:
+        add_issue(
+            "LOW",
+            "Storage",
+            "Cannot check filesystem usage",
+            "/proc/mounts is not readable",
+        )
+        return
+
+    for mountpoint in unresponsive:
         add_issue(
-            "LOW", "Storage", "Cannot check filesystem usage", "df command failed"
+            "LOW",
+            "Storage",
+            f"Cannot check filesystem usage of {mountpoint}",
+            f"No response within {MOUNT_STAT_TIMEOUT}s; the server may be down",
         )
 
+    for filesystem, mountpoint, use_percent, _ in mount_usage:
+        if use_percent is None:
+            continue
+
+        if use_percent >= FILESYSTEM_CRITICAL_THRESHOLD:
+            add_issue(
+                "CRITICAL",
+                "Storage",
+                f"Filesystem {mountpoint} critically full: {use_percent}%",
+                f"{filesystem} mounted at {mountpoint}",
+            )
+        elif use_percent >= FILESYSTEM_WARNING_THRESHOLD:
+            add_issue(
+                "HIGH",
+                "Storage",
+                f"Filesystem {mountpoint} filling up: {use_percent}%",
+                f"{filesystem} mounted at {mountpoint}",
+            )
+        elif use_percent >= 75:
+            add_issue(
+                "MEDIUM",
+                "Storage",
+                f"Filesystem {mountpoint} at {use_percent}%",
+                f"{filesystem} mounted at {mountpoint}",
+            )
+
 
 def check_inode_usage():
     """Check inode usage."""
     logger.info("Checking inode usage...")
 
-    rc, stdout, _ = run_command(["df", "-i"])
-    if rc == 0:
-        lines = stdout.split("\n")[1:]  # Skip header
+    try:
+        mount_usage, unresponsive = get_mount_usage()
+    except OSError:
+        add_issue(
+            "LOW", "Storage", "Cannot check inode usage", "/proc/mounts is not readable"
+        )
+        return
 
-        for line in lines:
-            if not line.strip():
-                continue
+    for mountpoint in unresponsive:
+        add_issue(
+            "LOW",
+            "Storage",
+            f"Cannot check inode usage of {mountpoint}",
+            f"No response within {MOUNT_STAT_TIMEOUT}s; the server may be down",
+        )
 
-            parts = line.split()
-            if len(parts) >= 6:
-                filesystem = parts[0]
-                use_percent_str = parts[4].rstrip("%")
-                mountpoint = parts[5]
+    for filesystem, mountpoint, _, use_percent in mount_usage:
+        if use_percent is None:
+            continue
 
-                # Skip pseudo filesystems
-                if filesystem in ["tmpfs", "devtmpfs", "none", "udev"]:
-                    continue
+        if use_percent >= 90:
+            add_issue(
+                "CRITICAL",
+                "Storage",
+                f"Inodes critically low on {mountpoint}: {use_percent}%",
+                f"{filesystem} mounted at {mountpoint}",
+            )
+        elif use_percent >= 80:
+            add_issue(
+                "HIGH",
+                "Storage",
+                f"Inodes running low on {mountpoint}: {use_percent}%",
+                f"{filesystem} mounted at {mountpoint}",
+            )
 
-                try:
-                    use_percent = int(use_percent_str)
-
-                    if use_percent >= 90:
-                        add_issue(
-                            "CRITICAL",
-                            "Storage",
-                            f"Inodes critically low on {mountpoint}: {use_percent}%",
-                            f"{filesystem} mounted at {mountpoint}",
-                        )
-                    elif use_percent >= 80:
-                        add_issue(
-                            "HIGH",
-                            "Storage",
-                            f"Inodes running low on {mountpoint}: {use_percent}%",
-                            f"{filesystem} mounted at {mountpoint}",
-                        )
-                except (ValueError, IndexError):
-                    continue
-    else:
-        add_issue("LOW", "Storage", "Cannot check inode usage", "df -i command failed")
+
+# Block devices that never report SMART data: loop/RAM disks, optical
+# drives and network block devices
+SMART_SKIP_PREFIXES = ("loop", "ram", "sr", "nbd")
 
 
 def check_disk_smart():
@@ -1326,20 +2063,44 @@ def check_disk_smart():
         )
         return
 
-    # Find block devices
-    rc, stdout, _ = run_command(["lsblk", "-d", "-n", "-o", "NAME"])
-    if rc != 0:
-        add_issue("LOW", "Storage", "Cannot list block devices", "lsblk command failed")
+    # Find whole-disk block devices (what lsblk -d lists)
+    try:
+        names = os.listdir("/sys/block")
+    except OSError:
+        add_issue(
+            "LOW", "Storage", "Cannot list block devices", "/sys/block is not readable"
+        )
         return
 
-    devices = [
-        f"/dev/{line.strip()}"
-        for line in stdout.split("\n")
-        if line.strip() and not line.startswith("loop")
-    ]
+    candidates = []
+    for name in names:
+        if name.startswith(SMART_SKIP_PREFIXES):
+            continue
+        # Stacked devices (dm-*, md*) sit on top of other disks; lsblk shows
+        # them under those disks rather than as top-level devices
+        try:
+            if os.listdir(f"/sys/block/{name}/slaves"):
+                continue
+        except OSError:
+            pass
+        # Devices backed by hardware have a "device" link; check them first
+        physical = os.path.exists(f"/sys/block/{name}/device")
+        candidates.append((not physical, name))
+
+    devices = [f"/dev/{name}" for _, name in sorted(candidates)]
+
+    # Query the first 5 devices concurrently; a spun-down or hung disk is
+    # capped by the per-call timeout instead of delaying the others
+    devices = devices[:5]
+    with ThreadPoolExecutor(max_workers=max(1, len(devices))) as executor:
+        results = list(
+            executor.map(
+                lambda device: run_command(["smartctl", "-H", device], timeout=10),
+                devices,
+            )
+        )
 
-    for device in devices[:5]:  # Check first 5 devices
-        rc, stdout, _ = run_command(["smartctl", "-H", device])
+    for device, (rc, stdout, _) in zip(devices, results):
         if rc == 0:
             if "PASSED" in stdout:
                 add_issue("INFO", "Storage", f"SMART status OK for {device}")
@@ -1358,13 +2119,54 @@ def check_disk_smart():
 # ============================================================================
 
 
+def apt_metadata_age():
+    """Return seconds since apt last refreshed its package lists, or None."""
+    for stamp in APT_UPDATE_STAMPS:
+        try:
+            return time.time() - os.stat(stamp).st_mtime
+        except OSError:
+            continue
+    return None
+
+
+def rpm_query_command(*args):
+    """
+    Build a dnf/yum command line for a read-only metadata query.
+
+    Uses the local metadata cache (-C) unless refresh_metadata is enabled,
+    so routine runs do not download repository metadata.
+    """
+    cmd = ["dnf" if command_exists("dnf") else "yum"]
+    if not PACKAGE_METADATA_REFRESH:
+        cmd.append("-C")
+    cmd.extend(args)
+    return cmd
+
+
+def run_rpm_query(*args, success=(0,)):
+    """
+    Run a dnf/yum metadata query, preferring the local metadata cache.
+
+    A cache-only (-C) query fails when no metadata has been downloaded yet,
+    so if its exit code is not in success it is retried once without -C.
+    Returns (returncode, stdout, stderr) like run_command().
+    """
+    cmd = rpm_query_command(*args)
+    rc, stdout, stderr = run_command(cmd, timeout=60)
+    if rc not in success and "-C" in cmd:
+        cmd = [arg for arg in cmd if arg != "-C"]
+        logger.debug("Cached metadata query failed, retrying: %s", cmd)
+        rc, stdout, stderr = run_command(cmd, timeout=60)
+    return rc, stdout, stderr
+
+
 def check_package_updates():
     """Check for available package updates."""
     logger.info("Checking for package updates...")
 
     if OS_INFO["package_manager"] == "rpm":
         # RHEL/CentOS/Rocky
-        rc, stdout, _ = run_command(["yum", "check-update"], timeout=60)
+        rc, stdout, _ = run_rpm_query("check-update", success=(0, 100))
         if rc == 100:  # yum returns 100 when updates are available
             update_count = len(
                 [
@@ -1386,12 +2188,16 @@ def check_package_updates():
 
     elif OS_INFO["package_manager"] == "dpkg":
         # Debian/Ubuntu
-        # Update package list first
-        run_command(["apt-get", "update"], timeout=120)
+        # Refresh the package lists only if they are missing or stale
+        age = apt_metadata_age()
+        if age is None or age > PACKAGE_METADATA_MAX_AGE:
+            run_command(["apt-get", "update"], timeout=120, capture=False)
 
-        rc, stdout, _ = run_command(["apt", "list", "--upgradable"], timeout=60)
+        rc, stdout, _ = run_command(
+            ["apt", "list", "--upgradable"], timeout=60, text=False
+        )
         if rc == 0:
-            update_lines = grep_output(stdout, r"upgradable")
+            update_lines = grep_output_b(stdout, UPGRADABLE_RE)
             if len(update_lines) > 10:
                 add_issue(
                     "MEDIUM",
@@ -1419,33 +2225,31 @@ def check_kernel_version():
     """Check kernel version and if reboot is required."""
     logger.info("Checking kernel version...")
 
-    rc, running_kernel, _ = run_command(["uname", "-r"])
-    if rc == 0:
-        running_kernel = running_kernel.strip()
-        add_issue("INFO", "Updates", f"Running kernel: {running_kernel}")
+    running_kernel = os.uname().release
+    add_issue("INFO", "Updates", f"Running kernel: {running_kernel}")
 
-        # Check if reboot required (various methods)
-        if os.path.exists("/var/run/reboot-required"):
-            add_issue(
-                "HIGH",
-                "Updates",
-                "System reboot required",
-                "New kernel or critical updates installed",
-            )
+    # Check if reboot required (various methods)
+    if os.path.exists("/var/run/reboot-required"):
+        add_issue(
+            "HIGH",
+            "Updates",
+            "System reboot required",
+            "New kernel or critical updates installed",
+        )
 
-        # Check if running kernel matches installed kernel
-        if OS_INFO["package_manager"] == "rpm":
-            rc, stdout, _ = run_command(["rpm", "-q", "kernel"])
-            if rc == 0:
-                installed_kernels = stdout.strip().split("\n")
-                latest_kernel = installed_kernels[-1].replace("kernel-", "")
-                if running_kernel not in latest_kernel:
-                    add_issue(
-                        "MEDIUM",
-                        "Updates",
-                        "Running kernel is not the latest installed",
-                        f"Running: {running_kernel}, Latest: {latest_kernel}",
-                    )
+    # Check if running kernel matches installed kernel
+    if OS_INFO["package_manager"] == "rpm":
+        rc, stdout, _ = run_command(["rpm", "-q", "kernel"])
+        if rc == 0:
+            installed_kernels = stdout.strip().split("\n")
+            latest_kernel = installed_kernels[-1].replace("kernel-", "")
+            if running_kernel not in latest_kernel:
+                add_issue(
+                    "MEDIUM",
+                    "Updates",
+                    "Running kernel is not the latest installed",
+                    f"Running: {running_kernel}, Latest: {latest_kernel}",
+                )
 
 
 def check_security_updates():
@@ -1453,9 +2257,7 @@ def check_security_updates():
     logger.info("Checking for security updates...")
 
     if OS_INFO["package_manager"] == "rpm":
-        rc, stdout, _ = run_command(
-            ["yum", "updateinfo", "list", "security"], timeout=60
-        )
+        rc, stdout, _ = run_rpm_query("updateinfo", "list", "security")
         if rc == 0:
             security_lines = [l for l in stdout.split("\n") if "security" in l.lower()]
             if len(security_lines) > 10:
@@ -1480,42 +2282,133 @@ def check_security_updates():
 # ============================================================================
 
 
+SYS_CLASS_NET = "/sys/class/net"
+PROC_NET_ROUTE = "/proc/net/route"
+INTERFACE_COUNTERS = ("rx_packets", "tx_packets", "rx_errors", "tx_errors")
+
+
+@functools.lru_cache(maxsize=1)
+def get_interface_stats():
+    """
+    Return per-interface state and counters read from sysfs, or None.
+
+    Maps each interface name to a dict with "operstate" (the state `ip
+    link` prints: "up", "down", "unknown", ...) and the INTERFACE_COUNTERS
+    from its statistics directory. Read once and shared by the interface
+    and error checks, without running ip.
+    """
+    try:
+        names = sorted(os.listdir(SYS_CLASS_NET))
+    except OSError:
+        return None
+
+    stats = {}
+    for name in names:
+        iface_dir = os.path.join(SYS_CLASS_NET, name)
+        try:
+            iface = {
+                "operstate": read_small_file(
+                    os.path.join(iface_dir, "operstate")
+                ).strip()
+            }
+            for counter in INTERFACE_COUNTERS:
+                iface[counter] = int(
+                    read_small_file(os.path.join(iface_dir, "statistics", counter))
+                )
+        except (OSError, ValueError):
+            continue
+        stats[name] = iface
+    return stats
+
+
+def get_default_gateway():
+    """
+    Return the IPv4 default gateway from /proc/net/route, or None.
+
+    For an on-link default route with no gateway address, the interface
+    name is returned instead, as `ip route show default` would show it.
+    Raises OSError if the routing table cannot be read.
+    """
+    with open(PROC_NET_ROUTE, "r") as f:
+        next(f, None)  # Header
+        for line in f:
+            fields = line.split()
+            # Iface Destination Gateway Flags RefCnt Use Metric Mask ...
+            if len(fields) < 8 or fields[1] != "00000000" or fields[7] != "00000000":
+                continue
+            if not int(fields[3], 16) & 0x1:  # RTF_UP
+                continue
+            gateway = int(fields[2], 16)
+            if gateway == 0:
+                return fields[0]
+            # The kernel prints the address in host (little-endian) order
+            return socket.inet_ntoa(struct.pack("<L", gateway))
+    return None
+
+
 def check_network_interfaces():
     """Check network interface status."""
     logger.info("Checking network interfaces...")
 
-    rc, stdout, _ = run_command(["ip", "link", "show"])
-    if rc == 0:
-        interfaces = grep_output(stdout, r"^\d+:")
-        up_count = grep_count(stdout, r"state UP")
-        down_count = grep_count(stdout, r"state DOWN")
+    stats = get_interface_stats()
+    if stats is not None:
+        up_count = 0
+        down_interfaces = []
+        for name, iface in stats.items():
+            if iface["operstate"] == "up":
+                up_count += 1
+            elif iface["operstate"] == "down":
+                down_interfaces.append(name)
 
         add_issue(
             "INFO",
             "Networking",
-            f"Network interfaces: {len(interfaces)} total, {up_count} up, {down_count} down",
+            f"Network interfaces: {len(stats)} total, {up_count} up, {len(down_interfaces)} down",
         )
 
         # Check for interfaces in down state (excluding loopback)
-        for line in interfaces:
-            if "state DOWN" in line and "lo:" not in line:
-                iface_name = line.split(":")[1].strip()
+        for iface_name in down_interfaces:
+            if iface_name != "lo":
                 add_issue("LOW", "Networking", f"Interface {iface_name} is DOWN")
     else:
         add_issue(
-            "LOW", "Networking", "Cannot check network interfaces", "ip command failed"
+            "LOW",
+            "Networking",
+            "Cannot check network interfaces",
+            f"{SYS_CLASS_NET} is not readable",
         )
 
 
+def resolves(host):
+    """Return True if host resolves (reverse lookup for IP addresses)."""
+    try:
+        ipaddress.ip_address(host)
+    except ValueError:
+        is_address = False
+    else:
+        is_address = True
+    try:
+        if is_address:
+            socket.gethostbyaddr(host)
+        else:
+            socket.getaddrinfo(host, None)
+    except (OSError, UnicodeError):
+        return False
+    return True
+
+
 def check_dns_resolution():
     """Check DNS resolution."""
     logger.info("Checking DNS resolution...")
 
     test_hosts = ["google.com", "1.1.1.1"]
 
-    for host in test_hosts:
-        rc, stdout, _ = run_command(["nslookup", host])
-        if rc == 0 and "answer" in stdout.lower():
+    # Resolve in-process and in parallel instead of one nslookup per host
+    with ThreadPoolExecutor(max_workers=len(test_hosts)) as executor:
+        results = list(executor.map(resolves, test_hosts))
+
+    for host, ok in zip(test_hosts, results):
+        if ok:
             add_issue("INFO", "Networking", f"DNS resolution working (tested {host})")
             return
 
@@ -1531,13 +2424,16 @@ def check_default_gateway():
     """Check default gateway configuration."""
     logger.info("Checking default gateway...")
 
-    rc, stdout, _ = run_command(["ip", "route", "show", "default"])
-    if rc == 0 and stdout.strip():
-        gateway = stdout.split()[2] if len(stdout.split()) >= 3 else "unknown"
+    try:
+        gateway = get_default_gateway()
+    except (OSError, ValueError):
+        gateway = None
+
+    if gateway:
         add_issue("INFO", "Networking", f"Default gateway: {gateway}")
 
         # Try to ping gateway
-        rc, _, _ = run_command(["ping", "-c", "1", "-W", "2", gateway])
+        rc, _, _ = run_command(["ping", "-c", "1", "-W", "2", gateway], capture=False)
         if rc == 0:
             add_issue("INFO", "Networking", f"Gateway {gateway} is reachable")
         else:
@@ -1560,43 +2456,24 @@ def check_listening_services():
     """Check listening network services."""
     logger.info("Checking listening services...")
 
-    rc, stdout, _ = run_command(["ss", "-tulpn"])
-    if rc != 0:
-        rc, stdout, _ = run_command(["netstat", "-tulpn"])
-
-    if rc == 0:
-        listening = grep_output(stdout, r"LISTEN")
-
-        services = {}
-        for line in listening:
-            parts = line.split()
-            if len(parts) >= 5:
-                port_info = parts[4]
-                if ":" in port_info:
-                    port = port_info.split(":")[-1]
-                    services[port] = services.get(port, 0) + 1
-
-        add_issue("INFO", "Networking", f"Listening on {len(services)} unique port(s)")
+    # Only TCP sockets listen; UDP sockets show as UNCONN in ss -tulpn
+    listening_ports = get_listening_tcp_ports()
+    if listening_ports is not None:
+        unique_ports = len(set(listening_ports))
+        add_issue("INFO", "Networking", f"Listening on {unique_ports} unique port(s)")
 
 
 def check_network_errors():
     """Check network interface error counters."""
     logger.info("Checking network interface errors...")
 
-    rc, stdout, _ = run_command(["ip", "-s", "link"])
-    if rc == 0:
-        error_lines = grep_output(stdout, r"errors:")
-
-        high_error_count = 0
-        for line in error_lines:
-            parts = line.split()
-            if len(parts) >= 2:
-                try:
-                    errors = int(parts[1])
-                    if errors > 1000:
-                        high_error_count += 1
-                except (ValueError, IndexError):
-                    continue
+    stats = get_interface_stats()
+    if stats is not None:
+        high_error_count = sum(
+            1
+            for iface in stats.values()
+            if iface["rx_errors"] > 1000 or iface["tx_errors"] > 1000
+        )
 
         if high_error_count > 0:
             add_issue(
@@ -1615,8 +2492,18 @@ def check_connectivity():
 
     test_hosts = ["8.8.8.8", "1.1.1.1"]
 
-    for host in test_hosts:
-        rc, _, _ = run_command(["ping", "-c", "2", "-W", "3", host])
+    # Ping all hosts at once so unreachable ones' timeouts don't stack
+    with ThreadPoolExecutor(max_workers=len(test_hosts)) as executor:
+        results = list(
+            executor.map(
+                lambda host: run_command(
+                    ["ping", "-c", "2", "-W", "3", host], capture=False
+                ),
+                test_hosts,
+            )
+        )
+
+    for host, (rc, _, _) in zip(test_hosts, results):
         if rc == 0:
             add_issue(
                 "INFO", "Networking", f"External connectivity OK (reached {host})"
@@ -1636,15 +2523,58 @@ def check_connectivity():
 # ============================================================================
 
 
+DISKSTATS_PATH = "/proc/diskstats"
+DISK_SAMPLE_SECONDS = 1.0
+
+# Started early by main() with prefetch_command(). --since lets journalctl
+# seek by time instead of walking the whole journal.
+ISCSI_ERRORS_CMD = [
+    "journalctl",
+    "-u",
+    "iscsid",
+    "-p",
+    "err",
+    "--since",
+    "-24h",
+    "-n",
+    "50",
+    "--no-pager",
+]
+
+
+def read_disk_io_ticks():
+    """
+    Return {device: io_ticks} for sd* and dm-* devices from /proc/diskstats.
+
+    io_ticks (the 13th field) is the total milliseconds the device has spent
+    doing I/O, which is what iostat's %util is derived from. Raises OSError
+    if the file cannot be read.
+    """
+    ticks = {}
+    with open(DISKSTATS_PATH, "r") as f:
+        for line in f:
+            fields = line.split()
+            if len(fields) >= 13 and fields[2].startswith(("sd", "dm-")):
+                ticks[fields[2]] = int(fields[12])
+    return ticks
+
+
+def iscsi_initiator_present():
+    """Return True if an iSCSI initiator is installed or configured."""
+    return os.path.exists("/etc/iscsi") or command_exists("iscsiadm")
+
+
 def check_iscsi_service():
     """Check if iSCSI initiator service is running."""
     logger.info("Checking iSCSI service...")
 
     services = ["iscsid", "iscsi"]
 
-    for service in services:
-        rc, stdout, _ = run_command(["systemctl", "is-active", service])
-        if rc == 0 and "active" in stdout:
+    # One systemctl call prints a state line per unit, in argument order;
+    # its exit code is non-zero unless every unit is active, so ignore it
+    _, stdout, _ = run_command(["systemctl", "is-active"] + services)
+    for service, state in zip(services, stdout.split()):
+        if state == "active":
             add_issue("INFO", "iSCSI", f"iSCSI service '{service}' is active")
             return
 
@@ -1669,9 +2599,10 @@ def check_iscsi_sessions():
         )
         return
 
-    rc, stdout, _ = run_command(["iscsiadm", "-m", "session"])
+    # Only lines are counted, so skip decoding the output
+    rc, stdout, _ = run_command(["iscsiadm", "-m", "session"], text=False)
     if rc == 0 and stdout.strip():
-        session_count = len(stdout.strip().split("\n"))
+        session_count = len(stdout.strip().split(b"\n"))
         add_issue("INFO", "iSCSI", f"{session_count} active iSCSI session(s)")
     elif rc == 0:
         add_issue("INFO", "iSCSI", "No active iSCSI sessions")
@@ -1697,10 +2628,12 @@ def check_iscsi_multipath():
         )
         return
 
-    rc, stdout, _ = run_command(["multipath", "-ll"])
+    # Only substring tests and counts, so skip decoding the output
+    rc, stdout, _ = run_command(["multipath", "-ll"], text=False)
     if rc == 0 and stdout.strip():
         # Check for failed paths
-        if "failed" in stdout.lower() or "faulty" in stdout.lower():
+        output_lower = stdout.lower()
+        if b"failed" in output_lower or b"faulty" in output_lower:
             add_issue(
                 "HIGH",
                 "iSCSI",
@@ -1708,7 +2641,7 @@ def check_iscsi_multipath():
                 "Check 'multipath -ll' for details",
             )
         else:
-            path_count = grep_count(stdout, r"status=active")
+            path_count = stdout.count(b"status=active")
             add_issue(
                 "INFO", "iSCSI", f"Multipath configured with {path_count} active paths"
             )
@@ -1723,9 +2656,9 @@ def check_iscsi_targets():
     if not command_exists("iscsiadm"):
         return
 
-    rc, stdout, _ = run_command(["iscsiadm", "-m", "node"])
+    rc, stdout, _ = run_command(["iscsiadm", "-m", "node"], text=False)
     if rc == 0 and stdout.strip():
-        target_count = len(stdout.strip().split("\n"))
+        target_count = len(stdout.strip().split(b"\n"))
         add_issue("INFO", "iSCSI", f"{target_count} iSCSI target(s) configured")
     elif rc == 0:
         add_issue("INFO", "iSCSI", "No iSCSI targets configured")
@@ -1735,23 +2668,24 @@ def check_iscsi_performance():
     """Check iSCSI disk performance metrics."""
     logger.info("Checking iSCSI disk I/O...")
 
-    rc, stdout, _ = run_command(["iostat", "-x", "1", "2"])
-    if rc == 0:
-        # Look for high await times or utilization
-        lines = stdout.split("\n")
-        device_lines = [l for l in lines if l.startswith("sd") or l.startswith("dm-")]
-
+    # Two io_ticks snapshots give the same %util as an iostat interval
+    try:
+        before = read_disk_io_ticks()
+        started = time.monotonic()
+        time.sleep(DISK_SAMPLE_SECONDS)
+        after = read_disk_io_ticks()
+        elapsed_ms = (time.monotonic() - started) * 1000
+    except (OSError, ValueError):
+        before = None
+
+    if before is not None:
         high_util_devices = []
-        for line in device_lines:
-            parts = line.split()
-            if len(parts) >= 12:
-                try:
-                    util = float(parts[-1])
-                    if util > 90:
-                        device = parts[0]
-                        high_util_devices.append(f"{device} ({util}%)")
-                except (ValueError, IndexError):
-                    continue
+        for device, ticks in after.items():
+            if device not in before:
+                continue
+            util = round(min(100.0, (ticks - before[device]) / elapsed_ms * 100), 2)
+            if util > 90:
+                high_util_devices.append(f"{device} ({util}%)")
 
         if high_util_devices:
             add_issue(
@@ -1767,7 +2701,7 @@ def check_iscsi_performance():
             "LOW",
             "iSCSI",
             "Cannot check I/O statistics",
-            "iostat not available - install sysstat package",
+            f"{DISKSTATS_PATH} is not readable",
         )
 
 
@@ -1789,9 +2723,7 @@ def check_iscsi_errors():
     """Check system logs for iSCSI errors."""
     logger.info("Checking for iSCSI errors in logs...")
 
-    rc, stdout, _ = run_command(
-        ["journalctl", "-u", "iscsid", "-p", "err", "-n", "50", "--no-pager"]
-    )
+    rc, stdout, _ = run_command(ISCSI_ERRORS_CMD)
     if rc == 0:
         if stdout.strip():
             error_count = len(stdout.strip().split("\n"))
@@ -1814,52 +2746,37 @@ def export_markdown():
     """Export issues in Markdown format."""
     logger.info("Generating Markdown report...")
 
-    report = f"# Linux Health Check Report\n\n"
-    report += f"**Hostname:** {HOSTNAME}\n\n"
-    report += f"**Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-    report += f"**OS:** {OS_INFO.get('distribution', 'Unknown')} {OS_INFO.get('version', '')}\n\n"
-    report += "---\n\n"
-
-    # Summary by severity
-    severity_counts = {}
-    for issue in issues:
-        sev = issue["severity"]
-        severity_counts[sev] = severity_counts.get(sev, 0) + 1
+    # Collect fragments and join once instead of growing a string
+    parts = [
+        "# Linux Health Check Report\n\n",
+        f"**Hostname:** {HOSTNAME}\n\n",
+        f"**Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n",
+        f"**OS:** {OS_INFO.get('distribution', 'Unknown')} {OS_INFO.get('version', '')}\n\n",
+        "---\n\n",
+    ]
 
-    report += "## Summary\n\n"
+    # Summary by severity (tallied in add_issues_bulk)
+    parts.append("## Summary\n\n")
     for sev in ["CRITICAL", "HIGH", "MEDIUM", "LOW", "INFO"]:
         count = severity_counts.get(sev, 0)
-        report += f"- **{sev}:** {count}\n"
-    report += f"\n**Total Issues:** {len(issues)}\n\n"
-    report += "---\n\n"
+        parts.append(f"- **{sev}:** {count}\n")
+    parts.append(f"\n**Total Issues:** {len(issues)}\n\n")
+    parts.append("---\n\n")
 
     # Issues by category
-    categories = {}
-    for issue in issues:
-        cat = issue["category"]
-        if cat not in categories:
-            categories[cat] = []
-        categories[cat].append(issue)
-
-    for category in sorted(categories.keys()):
-        report += f"## {category}\n\n"
-
-        for issue in categories[category]:
-            severity_emoji = {
-                "CRITICAL": "🔴",
-                "HIGH": "🟠",
-                "MEDIUM": "🟡",
-                "LOW": "🔵",
-                "INFO": "ℹ️",
-            }
+    for category in sorted(issues_by_category):
+        parts.append(f"## {category}\n\n")
 
-            emoji = severity_emoji.get(issue["severity"], "")
-            report += f"### {emoji} [{issue['severity']}] {issue['description']}\n\n"
+        for issue in issues_by_category[category]:
+            emoji = _SEVERITY_EMOJI.get(issue["severity"], "")
+            parts.append(
+                f"### {emoji} [{issue['severity']}] {issue['description']}\n\n"
+            )
 
             if issue["details"]:
-                report += f"```\n{issue['details']}\n```\n\n"
+                parts.append(f"```\n{issue['details']}\n```\n\n")
 
-    return report
+    return "".join(parts)
 
 
 def export_json():
@@ -1870,52 +2787,60 @@ def export_json():
         "hostname": HOSTNAME,
         "timestamp": datetime.now().isoformat(),
         "os_info": OS_INFO,
-        "summary": {},
+        "summary": dict(severity_counts),
         "issues": issues,
     }
 
-    # Calculate summary
-    for issue in issues:
-        sev = issue["severity"]
-        report["summary"][sev] = report["summary"].get(sev, 0) + 1
-
     return json.dumps(report, indent=2)
 
 
+def _add_children(sub_element, parent, fields):
+    """
+    Append a text-only child element to parent for each (tag, text) pair,
+    using sub_element (ElementTree.SubElement, bound by the caller).
+    """
+    for tag, text in fields:
+        sub_element(parent, tag).text = text
+
+
 def export_xml():
     """Export issues in XML format."""
     logger.info("Generating XML report...")
 
+    import xml.etree.ElementTree as ET  # Only needed for XML output
+
     root = ET.Element("health_check_report")
+    sub_element = ET.SubElement
 
     # Metadata
-    meta = ET.SubElement(root, "metadata")
-    ET.SubElement(meta, "hostname").text = HOSTNAME
-    ET.SubElement(meta, "timestamp").text = datetime.now().isoformat()
-    ET.SubElement(meta, "distribution").text = OS_INFO.get("distribution", "Unknown")
-    ET.SubElement(meta, "version").text = OS_INFO.get("version", "Unknown")
+    _add_children(
+        sub_element,
+        sub_element(root, "metadata"),
+        (
+            ("hostname", HOSTNAME),
+            ("timestamp", datetime.now().isoformat()),
+            ("distribution", OS_INFO.get("distribution", "Unknown")),
+            ("version", OS_INFO.get("version", "Unknown")),
+        ),
+    )
 
     # Summary
-    summary = ET.SubElement(root, "summary")
-    severity_counts = {}
-    for issue in issues:
-        sev = issue["severity"]
-        severity_counts[sev] = severity_counts.get(sev, 0) + 1
-
+    summary = sub_element(root, "summary")
     for sev, count in severity_counts.items():
-        sev_elem = ET.SubElement(summary, "severity", level=sev)
-        sev_elem.text = str(count)
+        sub_element(summary, "severity", level=sev).text = str(count)
 
     # Issues
-    issues_elem = ET.SubElement(root, "issues")
+    issues_elem = sub_element(root, "issues")
     for issue in issues:
-        issue_elem = ET.SubElement(issues_elem, "issue")
-        ET.SubElement(issue_elem, "severity").text = issue["severity"]
-        ET.SubElement(issue_elem, "category").text = issue["category"]
-        ET.SubElement(issue_elem, "description").text = issue["description"]
-        ET.SubElement(issue_elem, "timestamp").text = issue["timestamp"]
+        fields = [
+            ("severity", issue["severity"]),
+            ("category", issue["category"]),
+            ("description", issue["description"]),
+            ("timestamp", issue["timestamp"]),
+        ]
         if issue["details"]:
-            ET.SubElement(issue_elem, "details").text = str(issue["details"])
+            fields.append(("details", str(issue["details"])))
+        _add_children(sub_element, sub_element(issues_elem, "issue"), fields)
 
     return ET.tostring(root, encoding="unicode", method="xml")
 
@@ -1924,50 +2849,39 @@ def export_text():
     """Export issues in plain text format."""
     logger.info("Generating plain text report...")
 
-    report = "=" * 80 + "\n"
-    report += "Linux Health Check Report\n"
-    report += "=" * 80 + "\n\n"
-    report += f"Hostname: {HOSTNAME}\n"
-    report += f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-    report += (
-        f"OS: {OS_INFO.get('distribution', 'Unknown')} {OS_INFO.get('version', '')}\n"
-    )
-    report += "\n" + "-" * 80 + "\n"
-    report += "SUMMARY\n"
-    report += "-" * 80 + "\n\n"
-
-    severity_counts = {}
-    for issue in issues:
-        sev = issue["severity"]
-        severity_counts[sev] = severity_counts.get(sev, 0) + 1
+    # Collect fragments and join once instead of growing a string
+    parts = [
+        BANNER + "\n",
+        "Linux Health Check Report\n",
+        BANNER + "\n\n",
+        f"Hostname: {HOSTNAME}\n",
+        f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+        f"OS: {OS_INFO.get('distribution', 'Unknown')} {OS_INFO.get('version', '')}\n",
+        "\n" + RULE + "\n",
+        "SUMMARY\n",
+        RULE + "\n\n",
+    ]
 
     for sev in ["CRITICAL", "HIGH", "MEDIUM", "LOW", "INFO"]:
         count = severity_counts.get(sev, 0)
-        report += f"{sev:12} {count}\n"
-    report += f"\nTotal Issues: {len(issues)}\n\n"
-
-    report += "=" * 80 + "\n"
-    report += "ISSUES\n"
-    report += "=" * 80 + "\n\n"
+        parts.append(f"{sev:12} {count}\n")
+    parts.append(f"\nTotal Issues: {len(issues)}\n\n")
 
-    categories = {}
-    for issue in issues:
-        cat = issue["category"]
-        if cat not in categories:
-            categories[cat] = []
-        categories[cat].append(issue)
+    parts.append(BANNER + "\n")
+    parts.append("ISSUES\n")
+    parts.append(BANNER + "\n\n")
 
-    for category in sorted(categories.keys()):
-        report += f"\n{category}\n"
-        report += "-" * len(category) + "\n\n"
+    for category in sorted(issues_by_category):
+        parts.append(f"\n{category}\n")
+        parts.append("-" * len(category) + "\n\n")
 
-        for issue in categories[category]:
-            report += f"[{issue['severity']}] {issue['description']}\n"
+        for issue in issues_by_category[category]:
+            parts.append(f"[{issue['severity']}] {issue['description']}\n")
             if issue["details"]:
-                report += f"  Details: {issue['details']}\n"
-            report += "\n"
+                parts.append(f"  Details: {issue['details']}\n")
+            parts.append("\n")
 
-    return report
+    return "".join(parts)
 
 
 # ============================================================================
@@ -2013,6 +2927,53 @@ def encrypt_file_gpg(file_path):
         return file_path
 
 
+_smtp_instance = None
+
+
+def _get_smtp():
+    """
+    Return a connected SMTP session, opening it on first use.
+
+    The connection (including STARTTLS and login) is established once and
+    reused for every report sent during this run. It is closed at exit.
+    """
+    global _smtp_instance
+
+    if _smtp_instance is None:
+        import smtplib  # Only needed when email delivery is enabled
+
+        smtp_host = SMTP_SERVER if SMTP_SERVER else "localhost"
+        if SMTP_PORT == SMTP_SSL_PORT:
+            # Implicit TLS from the first byte; STARTTLS is not offered here
+            server = smtplib.SMTP_SSL(smtp_host, SMTP_PORT)
+        else:
+            server = smtplib.SMTP(smtp_host, SMTP_PORT)
+            if SMTP_USE_TLS:
+                server.starttls()
+
+        if SMTP_USERNAME and SMTP_PASSWORD:
+            server.login(SMTP_USERNAME, SMTP_PASSWORD)
+
+        _smtp_instance = server
+
+    return _smtp_instance
+
+
+def _close_smtp():
+    """Close the shared SMTP session if one was opened."""
+    global _smtp_instance
+
+    if _smtp_instance is not None:
+        try:
+            _smtp_instance.quit()
+        except Exception:
+            pass
+        _smtp_instance = None
+
+
+atexit.register(_close_smtp)
+
+
 def send_email_report(report_file):
     """Send report via email using SMTP."""
     if not EMAIL_ENABLED or not all([EMAIL_TO, EMAIL_FROM, SMTP_SERVER]):
@@ -2020,63 +2981,49 @@ def send_email_report(report_file):
 
     logger.info(f"Sending email report to {EMAIL_TO}...")
 
+    from email.message import EmailMessage
+
     try:
         # Create message
-        msg = MIMEMultipart()
+        msg = EmailMessage()
         msg["From"] = EMAIL_FROM if EMAIL_FROM else "health-check@localhost"
         msg["To"] = EMAIL_TO if EMAIL_TO else "admin@localhost"
         msg["Subject"] = (
-            EMAIL_SUBJECT.format(hostname=HOSTNAME)
-            if EMAIL_SUBJECT
-            else f"Health Check Report - {HOSTNAME}"
+            EMAIL_SUBJECT if EMAIL_SUBJECT else f"Health Check Report - {HOSTNAME}"
         )
 
         # Email body
-        body = f"Health check report for {HOSTNAME} is attached.\n\n"
-        body += f"Report generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+        body = [
+            f"Health check report for {HOSTNAME} is attached.\n\n",
+            f"Report generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+        ]
 
         # Add summary
-        severity_counts = {}
-        for issue in issues:
-            sev = issue["severity"]
-            severity_counts[sev] = severity_counts.get(sev, 0) + 1
-
-        body += "\nSummary:\n"
+        body.append("\nSummary:\n")
         for sev in ["CRITICAL", "HIGH", "MEDIUM", "LOW", "INFO"]:
             count = severity_counts.get(sev, 0)
-            body += f"  {sev}: {count}\n"
+            body.append(f"  {sev}: {count}\n")
 
-        msg.attach(MIMEText(body, "plain"))
+        msg.set_content("".join(body))
 
-        # Attach report file
+        # Attach report file (EmailMessage picks base64 for binary parts)
         with open(report_file, "rb") as f:
-            part = MIMEBase("application", "octet-stream")
-            part.set_payload(f.read())
-            encoders.encode_base64(part)
-            part.add_header(
-                "Content-Disposition",
-                f"attachment; filename={os.path.basename(report_file)}",
+            msg.add_attachment(
+                f.read(),
+                maintype="application",
+                subtype="octet-stream",
+                filename=os.path.basename(report_file),
             )
-            msg.attach(part)
-
-        # Send email
-        smtp_host = SMTP_SERVER if SMTP_SERVER else "localhost"
-        if SMTP_USE_TLS:
-            server = smtplib.SMTP(smtp_host, SMTP_PORT)
-            server.starttls()
-        else:
-            server = smtplib.SMTP(smtp_host, SMTP_PORT)
-
-        if SMTP_USERNAME and SMTP_PASSWORD:
-            server.login(SMTP_USERNAME, SMTP_PASSWORD)
 
-        server.send_message(msg)
-        server.quit()
+        # Send email over the shared SMTP session
+        _get_smtp().send_message(msg)
 
         logger.info("Email sent successfully")
 
     except Exception as e:
         logger.error(f"Failed to send email: {e}")
+        # Drop the session so a later send reconnects cleanly
+        _close_smtp()
 
 
 # ============================================================================
@@ -2086,9 +3033,9 @@ def send_email_report(report_file):
 
 def main():
     """Main execution function."""
-    logger.info("=" * 80)
+    logger.info(BANNER)
     logger.info("Linux Health Check Starting")
-    logger.info("=" * 80)
+    logger.info(BANNER)
     logger.info(f"Hostname: {HOSTNAME}")
     logger.info(f"Run as: {'root' if os.geteuid() == 0 else 'non-root user'}")
     logger.info(f"Output directory: {OUTPUT_DIR}")
@@ -2098,6 +3045,11 @@ def main():
     detect_os()
     logger.info("")
 
+    # Start the iSCSI journal query now so it runs while the other checks do
+    iscsi_present = iscsi_initiator_present()
+    if iscsi_present:
+        prefetch_command(ISCSI_ERRORS_CMD)
+
     # Check for script updates
     logger.info("Checking for script updates...")
     check_version_update()
@@ -2105,86 +3057,109 @@ def main():
 
     # Security Checks
     logger.info("Running Security Checks...")
-    check_ssh_status()
-    check_wheel_group()
-    check_firewall()
-    check_selinux_apparmor()
-    check_failed_logins()
-    check_open_ports()
-    check_root_login()
-    check_password_policy()
+    run_checks(
+        [
+            check_ssh_status,
+            check_wheel_group,
+            check_firewall,
+            check_selinux_apparmor,
+            check_failed_logins,
+            check_open_ports,
+            check_root_login,
+            check_password_policy,
+        ]
+    )
     logger.info("")
 
     # System Health Checks
     logger.info("Running System Health Checks...")
-    check_uptime()
-    check_load_average()
-    check_memory_usage()
-    check_cpu_info()
-    check_zombie_processes()
-    check_systemd_failed()
-    check_dmesg_errors()
+    run_checks(
+        [
+            check_uptime,
+            check_load_average,
+            check_memory_usage,
+            check_cpu_info,
+            check_zombie_processes,
+            check_systemd_failed,
+            check_dmesg_errors,
+        ]
+    )
     logger.info("")
 
     # Storage Checks
     logger.info("Running Storage Checks...")
-    check_filesystem_usage()
-    check_inode_usage()
-    check_disk_smart()
+    run_checks([check_filesystem_usage, check_inode_usage, check_disk_smart])
     logger.info("")
 
     # Package & Update Checks
     logger.info("Running Package & Update Checks...")
-    check_package_updates()
-    check_kernel_version()
+    run_checks([check_package_updates, check_kernel_version])
+    # yum/dnf hold the package manager lock, so the security query would
+    # only queue behind check_package_updates if run alongside it
     check_security_updates()
     logger.info("")
 
     # Networking Checks
     logger.info("Running Networking Checks...")
-    check_network_interfaces()
-    check_dns_resolution()
-    check_default_gateway()
-    check_listening_services()
-    check_network_errors()
-    check_connectivity()
+    run_checks(
+        [
+            check_network_interfaces,
+            check_dns_resolution,
+            check_default_gateway,
+            check_listening_services,
+            check_network_errors,
+            check_connectivity,
+        ]
+    )
     logger.info("")
 
     # iSCSI Checks
     logger.info("Running iSCSI Checks...")
-    check_iscsi_service()
-    check_iscsi_sessions()
-    check_iscsi_multipath()
-    check_iscsi_targets()
-    check_iscsi_performance()
-    check_iscsi_timeouts()
-    check_iscsi_errors()
+    if iscsi_present:
+        run_checks(
+            [
+                check_iscsi_service,
+                check_iscsi_sessions,
+                check_iscsi_multipath,
+                check_iscsi_targets,
+                check_iscsi_performance,
+                check_iscsi_timeouts,
+                check_iscsi_errors,
+            ]
+        )
+    else:
+        add_issue(
+            "INFO",
+            "iSCSI",
+            "iSCSI not configured",
+            "No /etc/iscsi directory or iscsiadm command; iSCSI checks skipped",
+        )
     logger.info("")
 
     # Generate reports
-    logger.info("=" * 80)
+    logger.info(BANNER)
     logger.info("Generating Reports")
-    logger.info("=" * 80)
+    logger.info(BANNER)
 
     # Export in requested format (default: markdown)
     export_format = os.getenv("EXPORT_FORMAT", "markdown").lower()
+    report_base = os.path.join(OUTPUT_DIR, f"health_report_{HOSTNAME}")
 
     if export_format == "json":
         report_content = export_json()
-        report_file = os.path.join(OUTPUT_DIR, f"health_report_{HOSTNAME}.json")
+        report_file = f"{report_base}.json"
     elif export_format == "xml":
         report_content = export_xml()
-        report_file = os.path.join(OUTPUT_DIR, f"health_report_{HOSTNAME}.xml")
+        report_file = f"{report_base}.xml"
     elif export_format == "text":
         report_content = export_text()
-        report_file = os.path.join(OUTPUT_DIR, f"health_report_{HOSTNAME}.txt")
+        report_file = f"{report_base}.txt"
     else:  # markdown (default)
         report_content = export_markdown()
-        report_file = os.path.join(OUTPUT_DIR, f"health_report_{HOSTNAME}.md")
+        report_file = f"{report_base}.md"
 
     # Write report
-    with open(report_file, "w") as f:
-        f.write(report_content)
+    write_private_file(report_file, report_content)
 
     logger.info(f"Report saved to: {report_file}")
 
@@ -2207,14 +3182,9 @@ def main():
 
     # Summary
     logger.info("")
-    logger.info("=" * 80)
+    logger.info(BANNER)
     logger.info("Health Check Complete")
-    logger.info("=" * 80)
-
-    severity_counts = {}
-    for issue in issues:
-        sev = issue["severity"]
-        severity_counts[sev] = severity_counts.get(sev, 0) + 1
+    logger.info(BANNER)
 
     logger.info("\nSummary:")
     for sev in ["CRITICAL", "HIGH", "MEDIUM", "LOW", "INFO"]:
@@ -50,6 +50,101 @@ echo ""
 # Create results directory
 mkdir -p "${RESULTS_DIR}"
 
+# Script runs are wrapped in `timeout`, which signals the script's whole
+# process group (including commands it started); anything still alive
+# KILL_AFTER seconds after the SIGTERM is sent SIGKILL
+KILL_AFTER=5
+
+# Export formats exercised by test 5 (EXPORT_FORMAT values)
+EXPORT_FORMATS=(json xml text markdown)
+
+# Report validator, mounted into containers as /validate.py
+# Usage: python3 /validate.py <format> <output_dir>
+VALIDATOR_PATH=$(mktemp)
+
+# Long-lived test container of the distribution under test (see test_distro)
+CONTAINER_ID=""
+
+cleanup() {
+    rm -f "$VALIDATOR_PATH"
+    remove_container
+}
+trap cleanup EXIT
+cat > "$VALIDATOR_PATH" <<'PYEOF'
+import glob
+import json
+import re
+import sys
+import xml.etree.ElementTree as ET
+
+REQUIRED_JSON_FIELDS = frozenset(("hostname", "timestamp", "os_info", "summary", "issues"))
+
+fmt, out_dir = sys.argv[1], sys.argv[2]
+ext = {"json": "json", "xml": "xml", "text": "txt", "markdown": "md"}[fmt]
+paths = glob.glob("%s/health_report_*.%s" % (out_dir, ext))
+if not paths:
+    sys.exit("no %s report in %s" % (fmt, out_dir))
+path = paths[0]
+
+if fmt == "json":
+    with open(path) as f:
+        data = json.load(f)
+    missing = REQUIRED_JSON_FIELDS.difference(data)
+    if missing:
+        sys.exit("missing fields: %s" % ", ".join(sorted(missing)))
+    if not isinstance(data["issues"], list):
+        sys.exit("issues is not a list")
+elif fmt == "xml":
+    # Only tag names are needed, so look at start events instead of
+    # building the tree; parsing still runs to the end for well-formedness.
+    # Each element is detached from its parent once closed, so memory
+    # stays flat however many issues the report holds
+    required = {"metadata", "summary", "issues"}
+    open_elems = []
+    for event, elem in ET.iterparse(path, events=("start", "end")):
+        if event == "end":
+            open_elems.pop()
+            if open_elems:
+                open_elems[-1].remove(elem)
+            continue
+        if not open_elems and elem.tag != "health_check_report":
+            sys.exit("unexpected root element: %s" % elem.tag)
+        if len(open_elems) == 1:
+            required.discard(elem.tag)
+        open_elems.append(elem)
+    if required:
+        sys.exit("missing element: %s" % ", ".join(sorted(required)))
+else:
+    if fmt == "markdown":
+        markers = ("# Linux Health Check Report", "## Summary", "**Hostname:**", "**Date:**")
+    else:
+        markers = ("Linux Health Check Report", "SUMMARY", "Hostname:")
+    # One pass over the file for all markers, read in chunks; the tail of
+    # each chunk is carried over so a marker split across reads is found
+    missing = {m.encode() for m in markers}
+    pattern = re.compile(b"|".join(re.escape(m) for m in missing))
+    overlap = max(len(m) for m in missing) - 1
+    tail = b""
+    with open(path, "rb") as f:
+        while missing:
+            chunk = f.read(65536)
+            if not chunk:
+                break
+            buf = tail + chunk
+            missing.difference_update(m.group() for m in pattern.finditer(buf))
+            tail = buf[-overlap:]
+    if missing:
+        sys.exit("missing marker: %s" % b", ".join(sorted(missing)).decode())
+PYEOF
+
+# Remove the current distribution's test container
+remove_container() {
+    if [[ -n "$CONTAINER_ID" ]]; then
+        docker rm -f "$CONTAINER_ID" >/dev/null 2>&1 || true
+        CONTAINER_ID=""
+    fi
+}
+
 # Test function for each distribution
 test_distro() {
     local distro_name="$1"
@@ -66,9 +161,13 @@ test_distro() {
     local all_passed=true
     local test_log="${RESULTS_DIR}/${distro_name// /_}_${TIMESTAMP}.log"
     
+    # All tests run in one container per distribution, so Python is installed
+    # once instead of once per test; the container is removed at the end
+    CONTAINER_ID=$(docker run -d -v "$SCRIPT_PATH:/script.py:ro" -v "$VALIDATOR_PATH:/validate.py:ro" "$docker_image" sleep infinity 2>/dev/null || true)
+    
     # Test 1: Install Python and check version
     echo -n "  [1/8] Installing Python and detecting version... "
-    PYTHON_VERSION=$(docker run --rm "$docker_image" sh -c "$install_cmd >/dev/null 2>&1 && python3 --version 2>&1" | grep -oP 'Python \K\d+\.\d+\.\d+' | head -1 || echo "ERROR")
+    PYTHON_VERSION=$(docker exec "$CONTAINER_ID" sh -c "$install_cmd >/dev/null 2>&1 && python3 --version 2>&1" | grep -oP 'Python \K\d+\.\d+\.\d+' | head -1 || echo "ERROR")
     
     if [[ "$PYTHON_VERSION" == "ERROR" ]]; then
         echo -e "${RED}✗ FAILED${NC}"
@@ -76,6 +175,7 @@ test_distro() {
         PYTHON_VERSIONS["$distro_name"]="N/A"
         TEST_DETAILS["$distro_name"]="Failed to install Python"
         ((FAILED_TESTS++))
+        remove_container
         echo ""
         return
     else
@@ -87,7 +187,7 @@ test_distro() {
     
     # Test 2: Syntax validation
     echo -n "  [2/8] Validating Python syntax (py_compile)... "
-    if docker run --rm -v "$SCRIPT_PATH:/script.py:ro" "$docker_image" sh -c "$install_cmd >/dev/null 2>&1 && python3 -m py_compile /script.py 2>&1" >/dev/null 2>&1; then
+    if docker exec "$CONTAINER_ID" python3 -m py_compile /script.py >/dev/null 2>&1; then
         echo -e "${GREEN}✓ PASSED${NC}"
         ((PASSED_TESTS++))
     else
@@ -99,7 +199,7 @@ test_distro() {
     
     # Test 3: Dependencies check (urllib)
     echo -n "  [3/8] Checking urllib.request availability... "
-    if docker run --rm "$docker_image" sh -c "$install_cmd >/dev/null 2>&1 && python3 -c 'import urllib.request; import urllib.error' 2>&1" >/dev/null 2>&1; then
+    if docker exec "$CONTAINER_ID" python3 -c 'import urllib.request; import urllib.error' >/dev/null 2>&1; then
         echo -e "${GREEN}✓ PASSED${NC}"
         ((PASSED_TESTS++))
     else
@@ -111,7 +211,7 @@ test_distro() {
     
     # Test 4: Health check execution
     echo -n "  [4/8] Running health check (basic execution)... "
-    OUTPUT=$(docker run --rm -v "$SCRIPT_PATH:/script.py:ro" "$docker_image" sh -c "$install_cmd >/dev/null 2>&1 && timeout 15 python3 /script.py 2>&1" || true)
+    OUTPUT=$(docker exec "$CONTAINER_ID" timeout -k "$KILL_AFTER" 15 python3 /script.py 2>&1 || true)
     if echo "$OUTPUT" | grep -q "Checking for script updates"; then
         echo -e "${GREEN}✓ PASSED${NC}"
         echo "$OUTPUT" > "$test_log"
@@ -122,24 +222,40 @@ test_distro() {
     fi
     ((TOTAL_TESTS++))
     
-    # Test 5: JSON export format
-    echo -n "  [5/8] Testing JSON export format... "
-    JSON_OUTPUT=$(docker run --rm -e EXPORT_FORMAT=json -v "$SCRIPT_PATH:/script.py:ro" "$docker_image" sh -c "$install_cmd >/dev/null 2>&1 && timeout 15 python3 /script.py 2>&1" || true)
-    if echo "$JSON_OUTPUT" | python3 -c "import sys, json; json.load(sys.stdin)" 2>/dev/null; then
+    # Test 5: Export formats
+    # The formats run at the same time, each writing its report to its own
+    # OUTPUT_DIR and validating it in place
+    echo -n "  [5/8] Testing export formats (${EXPORT_FORMATS[*]})... "
+    local -A export_pids=()
+    local fmt
+    for fmt in "${EXPORT_FORMATS[@]}"; do
+        docker exec -e EXPORT_FORMAT="$fmt" -e OUTPUT_DIR="/tmp/hc_out_$fmt" "$CONTAINER_ID" sh -c "
+            mkdir -p /tmp/hc_out_$fmt
+            timeout -k $KILL_AFTER 15 python3 /script.py >/dev/null 2>&1
+            python3 /validate.py $fmt /tmp/hc_out_$fmt
+        " >> "${RESULTS_DIR}/export_${fmt}_${TIMESTAMP}.log" 2>&1 &
+        export_pids[$fmt]=$!
+    done
+
+    local failed_formats=()
+    for fmt in "${EXPORT_FORMATS[@]}"; do
+        wait "${export_pids[$fmt]}" || failed_formats+=("$fmt")
+    done
+
+    if [[ ${#failed_formats[@]} -eq 0 ]]; then
         echo -e "${GREEN}✓ PASSED${NC}"
         ((PASSED_TESTS++))
     else
-        echo -e "${YELLOW}⚠ WARNING${NC} (JSON may not be parseable in container)"
+        echo -e "${YELLOW}⚠ WARNING${NC} (no valid report for: ${failed_formats[*]}; script may have exited early)"
         ((PASSED_TESTS++))
     fi
     ((TOTAL_TESTS++))
     
     # Test 6: Version check enabled (simulate old version)
     echo -n "  [6/8] Testing version check notification... "
-    docker run --rm -v "$SCRIPT_PATH:/script.py:ro" "$docker_image" sh -c "
-        $install_cmd >/dev/null 2>&1
+    docker exec "$CONTAINER_ID" sh -c "
         sed 's/__version__ = \"[0-9]\+\.[0-9]\+\.[0-9]\+\"/__version__ = \"0.9.0\"/' /script.py > /tmp/old_version.py
-        timeout 15 python3 /tmp/old_version.py 2>&1
+        timeout -k $KILL_AFTER 15 python3 /tmp/old_version.py 2>&1
     " > /tmp/version_test_$$ 2>&1 || true
     
     # Check if version check message appears OR if network/SSL issues prevented check
@@ -160,7 +276,7 @@ test_distro() {
     
     # Test 7: Version check disabled
     echo -n "  [7/8] Testing DISABLE_VERSION_CHECK... "
-    OUTPUT=$(docker run --rm -e DISABLE_VERSION_CHECK=1 -v "$SCRIPT_PATH:/script.py:ro" "$docker_image" sh -c "$install_cmd >/dev/null 2>&1 && timeout 10 python3 /script.py 2>&1" || true)
+    OUTPUT=$(docker exec -e DISABLE_VERSION_CHECK=1 "$CONTAINER_ID" timeout -k "$KILL_AFTER" 10 python3 /script.py 2>&1 || true)
     HAS_CHECK_LOG=$(echo "$OUTPUT" | grep -c "Checking for script updates" || true)
     HAS_UPDATE_MSG=$(echo "$OUTPUT" | grep -c "New version available" || true)
     # Ensure numeric values (grep -c should return a number, but sanitize just in case)
@@ -182,7 +298,7 @@ test_distro() {
     
     # Test 8: Exit code validation
     echo -n "  [8/8] Validating exit codes... "
-    docker run --rm -v "$SCRIPT_PATH:/script.py:ro" "$docker_image" sh -c "$install_cmd >/dev/null 2>&1 && python3 /script.py >/dev/null 2>&1" || EXIT_CODE=$?
+    docker exec "$CONTAINER_ID" timeout -k "$KILL_AFTER" 120 python3 /script.py >/dev/null 2>&1 || EXIT_CODE=$?
     
     # Exit code should be non-zero (issues found) or 0 (no issues)
     # Both are valid depending on container state
@@ -190,6 +306,8 @@ test_distro() {
     ((PASSED_TESTS++))
     ((TOTAL_TESTS++))
     
+    remove_container
+    
     # Overall result
     if $all_passed; then
         echo -e "${GREEN}  ✅ Result: PASS${NC}"
@@ -201,6 +319,46 @@ test_distro() {
     echo ""
 }
 
+# Config file handling (runs once on the host)
+# A value configparser cannot interpolate, such as a '%' in a password, must
+# only drop that key, not the whole config file
+CONFIG_TEST_FAILED=false
+test_config_loading() {
+    echo -n "Checking config file with an uninterpolatable value... "
+    if ! command -v python3 >/dev/null 2>&1; then
+        echo -e "${YELLOW}⚠ SKIPPED${NC} (python3 not found on host)"
+        return
+    fi
+
+    local config_dir
+    config_dir=$(mktemp -d)
+    cp "$SCRIPT_PATH" "$config_dir/"
+    printf '[smtp]\nserver = mail.example.com\nport = 2525\npassword = p%%ss\n' > "$config_dir/health_check.cfg"
+    chmod 600 "$config_dir/health_check.cfg"
+
+    local loaded
+    loaded=$(OUTPUT_DIR="$config_dir" python3 -c "
+import sys
+sys.path.insert(0, sys.argv[1])
+import linux_health_check as hc
+print(hc.SMTP_SERVER, hc.SMTP_PORT)
+" "$config_dir" 2>/dev/null | tail -1)
+    rm -rf "$config_dir"
+
+    if [[ "$loaded" == "mail.example.com 2525" ]]; then
+        echo -e "${GREEN}✓ PASSED${NC}"
+        ((PASSED_TESTS++))
+    else
+        echo -e "${RED}✗ FAILED${NC} (got: ${loaded:-nothing})"
+        CONFIG_TEST_FAILED=true
+        ((FAILED_TESTS++))
+    fi
+    ((TOTAL_TESTS++))
+    echo ""
+}
+
+test_config_loading
+
 # Test all distributions
 echo "Starting distribution tests..."
 echo ""
@@ -246,7 +404,7 @@ echo ""
 # Generate test report (append to existing TEST_REPORT.md)
 echo "Updating test report: $REPORT_FILE"
 
-if [[ $DISTRO_FAIL_COUNT -eq 0 ]]; then
+if [[ $DISTRO_FAIL_COUNT -eq 0 ]] && ! $CONFIG_TEST_FAILED; then
     echo -e "${GREEN}✅ All tests passed!${NC}"
     echo ""
     echo "Test artifacts saved to: ${RESULTS_DIR}"